@@ -51,20 +51,29 @@ class HDLC:
     FLAG = 0x7E
     ESC = 0x7D
     ESC_MASK = 0x20
+    # pre-built byte sequences, reused for every frame
+    FLAG_BYTE = bytes([FLAG])
+    ESC_BYTE = bytes([ESC])
+    ESCAPED_FLAG = bytes([ESC, FLAG ^ ESC_MASK])
+    ESCAPED_ESC = bytes([ESC, ESC ^ ESC_MASK])
 
     @staticmethod
     def escape(data):
-        data = data.replace(bytes([HDLC.ESC]), bytes([HDLC.ESC, HDLC.ESC^HDLC.ESC_MASK]))
-        data = data.replace(bytes([HDLC.FLAG]), bytes([HDLC.ESC, HDLC.FLAG^HDLC.ESC_MASK]))
+        data = data.replace(HDLC.ESC_BYTE, HDLC.ESCAPED_ESC)
+        data = data.replace(HDLC.FLAG_BYTE, HDLC.ESCAPED_FLAG)
         return data
 
+    @staticmethod
+    def frame(data):
+        return HDLC.FLAG_BYTE + HDLC.escape(data) + HDLC.FLAG_BYTE
+
 
 def _rns_write_stdout(msg):
     # drop messages without destination set to @RNS group
     if not msg.is_directed_to('@RNS'):
         return
 
-    data = bytes([HDLC.FLAG]) + HDLC.escape(msg.encode()) + bytes([HDLC.FLAG])
+    data = HDLC.frame(msg.encode())
 
     try:
         sys.stdout.buffer.write(data)
@@ -77,43 +86,42 @@ def _rns_read_stdin():
     global MTU
     in_frame = False
     escape = False
-    data_buffer = b''
+    data_buffer = bytearray()
 
     while js8call.connected():
         try:
-            byte = sys.stdin.buffer.read(1)
+            # read whatever is available (up to MTU bytes) in a single call
+            data = sys.stdin.buffer.read1(MTU)
         except:
             js8call.stop()
             return
 
-        if len(byte) == 0:
+        if len(data) == 0:
             # EOF reached, pipe closed
             js8call.stop()
             break
 
-        byte = ord(byte)
-
-        if in_frame and byte == HDLC.FLAG:
-            in_frame = False
-
-            js8call.send_directed_bytes_message('@RNS', data_buffer)
-
-        elif byte == HDLC.FLAG:
-            in_frame = True
-            data_buffer = b''
-
-        elif in_frame and len(data_buffer) < MTU:
-            if byte == HDLC.ESC:
-                escape = True
-            else:
-                if escape:
-                    if byte == HDLC.FLAG ^ HDLC.ESC_MASK:
-                        byte = HDLC.FLAG
-                    if byte == HDLC.ESC ^ HDLC.ESC_MASK:
-                        byte = HDLC.ESC
-                    escape = False
-                data_buffer += bytes([byte])
-
+        for byte in data:
+            if in_frame and byte == HDLC.FLAG:
+                in_frame = False
+
+                js8call.send_directed_bytes_message('@RNS', bytes(data_buffer))
+
+            elif byte == HDLC.FLAG:
+                in_frame = True
+                data_buffer = bytearray()
+
+            elif in_frame and len(data_buffer) < MTU:
+                if byte == HDLC.ESC:
+                    escape = True
+                else:
+                    if escape:
+                        if byte == HDLC.FLAG ^ HDLC.ESC_MASK:
+                            byte = HDLC.FLAG
+                        if byte == HDLC.ESC ^ HDLC.ESC_MASK:
+                            byte = HDLC.ESC
+                        escape = False
+                    data_buffer.append(byte)
 
 if __name__ == '__main__':
     help_epilog =  'RNS PipeInterface must be configured and enabled in the Reticulum config file. '
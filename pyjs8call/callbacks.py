@@ -111,6 +111,8 @@ class Callbacks:
 
         Note that pyjs8call internal modules may register callback functions for specific message type handling. Keep this in mind if minipulating registered callback functions directly.
 
+        **Note:** Incoming message and command callback functions share a small, fixed set of worker threads. A callback function that blocks for a long time (ex. network requests) delays other callback functions, and should hand its work off to its own thread. Callback functions registered by pyjs8call internal modules do not use these worker threads.
+
         Args:
             callback (func): Callback function object
             message_type (str): Associated message type, defaults to RX_DIRECTED
@@ -152,10 +154,7 @@ class Callbacks:
         Returns:
             list: Callback functions associated with the specified message type
         '''
-        if message_type in self.incoming:
-            return self.incoming[message_type]
-        else:
-            return []
+        return self.incoming.get(message_type, [])
 
     def register_command(self, cmd, callback):
         '''Register command callback function.
@@ -164,6 +163,8 @@ class Callbacks:
 
         **Note:** Custom commands are only processed for directed messages.
 
+        **Note:** Command callback functions share worker threads with incoming message callback functions, see *Callbacks.register_incoming*.
+
         Args:
             cmd (str): Command string
             callback (func): Callback function object
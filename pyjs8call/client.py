@@ -40,23 +40,124 @@ __docformat__ = 'google'
 
 
 import os
+import re
 import time
+import queue
 import shutil
 import atexit
+import bisect
+import configparser
 import threading
+import traceback
+from array import array
+from operator import itemgetter
 from math import radians, sin, cos, acos, atan2, pi
 
 import pyjs8call
 from pyjs8call import Message
 
 
+# characters stripped from the ends of incoming message text
+_STRIP_CHARS = ' ' + Message.EOM
+# leading command in outgoing directed message text,
+# alternatives sorted decending by command length to avoid matching a partial command
+_COMMAND_RE = re.compile('|'.join(re.escape(cmd) for cmd in sorted(Message.COMMANDS, key=len, reverse=True)))
+# first characters of all commands (case insensitive, commands start with a space or punctuation)
+_COMMAND_FIRST_CHARS = frozenset(cmd[0] for cmd in Message.COMMANDS)
+# commands confirming a directed rx text field message, excluding free text commands
+_DIRECTED_COMMANDS = tuple(cmd for cmd in Message.COMMANDS if cmd not in (Message.CMD_FREETEXT, Message.CMD_FREETEXT_2))
+# rx text field directed message text after origin, either:
+#   destination, double space, text (first double space, regardless of command)
+#   destination, command text (command at first space)
+_RX_DIRECTED_RE = re.compile(r'(.*?)  (.*)|([^ ]+)(?= )((?:' + '|'.join(re.escape(cmd) for cmd in _DIRECTED_COMMANDS) + r').*)', re.DOTALL)
+# rx text field message: hh:mm:ss - (offset) - text
+# time cannot contain a dash, which avoids matching negative SNR values in message text
+_RX_MSG_RE = re.compile(r'([^-]*?)\s*-\s*\((\d+)\)\s*-(.*)', re.DOTALL)
+# phone number formatting characters removed from APRS SMS numbers
+_PHONE_STRIP_TABLE = str.maketrans('', '', '-.()')
+# config file boolean strings accepted by configparser, unset and unknown values map to None
+_BOOL_MAP = configparser.ConfigParser.BOOLEAN_STATES
+# autoreply commands for hearing/heard by spot processing
+_AUTOREPLY_COMMANDS = frozenset(Message.AUTOREPLY_COMMANDS)
+# earth radius for great circle distance
+_EARTH_RADIUS_KM = 6371
+_EARTH_RADIUS_MI = 3958.756
+# maidenhead grid square degrees per field, square, and sub-square
+_GRID_FIELD_LON_DEG = 20
+_GRID_FIELD_LAT_DEG = 10
+_GRID_SQUARE_LON_DEG = 2
+_GRID_SQUARE_LAT_DEG = 1
+_GRID_SUB_SQUARE_LON_DEG = 1/12
+_GRID_SUB_SQUARE_LAT_DEG = 1/24
+# maidenhead grid square field (A-R) and sub-square (A-X) letter indexes
+_GRID_FIELD_INDEX = {letter: index for index, letter in enumerate('ABCDEFGHIJKLMNOPQR')}
+_GRID_SUB_SQUARE_INDEX = {letter: index for index, letter in enumerate('ABCDEFGHIJKLMNOPQRSTUVWX')}
+# activity sort keys
+_BY_TIMESTAMP = itemgetter('timestamp')
+_BY_OFFSET = itemgetter('offset')
+# inbox message unread flag
+_IS_UNREAD = itemgetter('unread')
+# module name prefix of callbacks registered by pyjs8call modules, run outside the callback worker threads
+_INTERNAL_MODULE_PREFIX = 'pyjs8call.'
+
+
+class _BandDict(dict):
+    '''Band dictionary that drops its cached lookup tables when edited, see Client.freq_to_band.'''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # parallel lookup tables built by _band_tables, None until built or after an edit
+        self.tables = None
+        # change count, lets _band_tables detect an edit made while building tables
+        self.version = 0
+
+    def _changed(self):
+        self.version += 1
+        self.tables = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+
 class Client:
     '''JS8Call API client.'''
     
     OOB = 'OOB'
     '''str: Out-of-band designator'''
 
-    BANDS = {
+    BANDS = _BandDict({
         '2190m':  (136000,       137000),
         '630m':   (472000,       479000),
         '560m':   (501000,       504000),
@@ -88,7 +189,7 @@ class Client:
         '2mm':    (142000000000, 149000000000),
         '1mm':    (241000000000, 250000000000),
         OOB: (0, 0)
-    }
+    })
     '''dict: Mapping of frequency band name to minimum and maximum frequencies'''
     
     @staticmethod
@@ -105,10 +206,25 @@ class Client:
         '''
         if freq is None:
             return Client.OOB
-            
-        for band, freqs in Client.BANDS.items():
-            if freqs[0] <= freq <= freqs[1]:
-                return band
+
+        bands = Client.BANDS
+
+        try:
+            tables = bands.tables
+        except AttributeError:
+            # Client.BANDS replaced with a plain dict
+            tables = None
+
+        if tables is None:
+            tables = _band_tables(bands)
+
+        min_freqs, max_freqs, names = tables
+
+        # bands do not overlap, so only the band with the nearest lower minimum frequency can match
+        i = bisect.bisect_right(min_freqs, freq) - 1
+
+        if i >= 0 and freq <= max_freqs[i]:
+            return names[i]
 
         return Client.OOB
 
@@ -125,7 +241,7 @@ class Client:
         Returned value is `(0, 0)` if band name is unknown.
         '''
         if band is None:
-            return Client.OOB
+            return Client.BANDS[Client.OOB]
             
         band = band.lower()
         
@@ -243,6 +359,11 @@ class Client:
 
         # delay between setting value and getting updated value
         self._set_get_delay = 0.1 # seconds
+        # user incoming message callbacks run by daemon worker threads, created on start
+        self._callback_queue = None
+        self._callback_workers = 8
+        # whether restart_when_inactive is waiting to restart
+        self._restart_pending = False
 
         # ensure js8call application is installed
         if shutil.which('js8call') is None:
@@ -254,20 +375,21 @@ class Client:
         self.js8call = pyjs8call.JS8Call(self, self.host, self.port)
         self.notifications = pyjs8call.Notifications(self)
 
-        if self.config.get('Configuration', 'pyjs8callCleanDirectedText') not in [None, 'None']:
-            config_clean_directed_text = self.config.get('Configuration', 'pyjs8callCleanDirectedText', bool)
-            if config_clean_directed_text is not None:
-                self.clean_directed_text = config_clean_directed_text
+        # read the config section once, pyjs8call options are not set until the first exit
+        config_options = self.config.get_section('Configuration')
 
-        if self.config.get('Configuration', 'pyjs8callMonitorOutgoing') not in [None, 'None']:
-            config_monitor_outgoing = self.config.get('Configuration', 'pyjs8callMonitorOutgoing', bool, fallback=self.monitor_outgoing)
-            if config_monitor_outgoing is not None:
-                self.monitor_outgoing = config_monitor_outgoing
+        config_clean_directed_text = _BOOL_MAP.get(config_options.get('pyjs8callCleanDirectedText', '').strip().lower())
+        if config_clean_directed_text is not None:
+            self.clean_directed_text = config_clean_directed_text
 
-        if self.config.get('Configuration', 'pyjs8callMaxSpotAge') not in [None, 'None']:
-            config_max_spot_age = self.config.get('Configuration', 'pyjs8callMaxSpotAge', int, fallback=self.max_spot_age)
-            if config_max_spot_age is not None:
-                self.max_spot_age = config_max_spot_age
+        config_monitor_outgoing = _BOOL_MAP.get(config_options.get('pyjs8callMonitorOutgoing', '').strip().lower())
+        if config_monitor_outgoing is not None:
+            self.monitor_outgoing = config_monitor_outgoing
+
+        try:
+            self.max_spot_age = int(config_options['pyjs8callMaxSpotAge'])
+        except (KeyError, ValueError):
+            pass
 
         # stop application and client at exit
         atexit.register(self.stop)
@@ -316,16 +438,11 @@ class Client:
         else:
             rig_name = None
 
-            # try to find the rig name switch, and then the following rig name
-            try:
-                rig_name = args[args.index('-r') + 1]
-            except ValueError:
-                pass
-
-            try:
-                rig_name = args[args.index('--rig-name') + 1]
-            except ValueError:
-                pass
+            # find the first rig name switch, and then the following rig name
+            for i, arg in enumerate(args[:-1]):
+                if arg in ('-r', '--rig-name'):
+                    rig_name = args[i + 1]
+                    break
 
             if rig_name is not None:
                 self.config.load_rig_config(rig_name)
@@ -345,6 +462,14 @@ class Client:
         self.js8call.start(headless = headless, args = args)
         self.online = True
 
+        # new queue per start, workers from a previous start exit on their own queue
+        self._callback_queue = queue.Queue()
+
+        for _ in range(self._callback_workers):
+            thread = threading.Thread(target=self._callback_worker, args=(self._callback_queue,))
+            thread.daemon = True
+            thread.start()
+
         if debugging:
             self.js8call.enable_debugging()
 
@@ -387,7 +512,7 @@ class Client:
         self.config.set('Configuration', 'pyjs8callMaxSpotAge', self.max_spot_age)
 
         # restore previous config profile
-        if self._previous_profile is not None and self._previous_profile in self.settings.get_profile_list():
+        if self._previous_profile is not None and self.config.profile_exists(self._previous_profile):
             self.settings.set_profile(self._previous_profile)
             
         self.config.write()
@@ -403,6 +528,11 @@ class Client:
         self.online = False
         self.exit_tasks()
 
+        if self._callback_queue is not None:
+            # one sentinel per worker, callbacks queued after stop are dropped
+            for _ in range(self._callback_workers):
+                self._callback_queue.put(None)
+
         self.js8call.app.terminate_js8call = terminate_js8call
             
         try:
@@ -448,7 +578,7 @@ class Client:
         args = self.js8call.app.args
         settings = self.js8call.restart_settings()
 
-        # stop
+        # stop, callback worker threads are intentionally kept and used by the new rx thread
         self.online = False
         self.js8call.stop()
         time.sleep(1)
@@ -484,14 +614,22 @@ class Client:
         Args:
             age (int): Maximum age in seconds of outgoing activity to consider active, defaults to 0
         '''
+        # only one pending restart at a time
+        if self._restart_pending:
+            return
+
+        self._restart_pending = True
         thread = threading.Thread(target=self._restart_when_inactive, args=(age,))
         thread.daemon = True
         thread.start()
         
     def _restart_when_inactive(self, age):
         '''Thread function to restart once there is no outgoing activity.'''
-        self.js8call.block_until_inactive(age = age)
-        self.restart()
+        try:
+            self.js8call.block_until_inactive(age = age)
+            self.restart()
+        finally:
+            self._restart_pending = False
         
     def set_profile_on_exit(self, profile):
         '''Set JS8Call configuration profile on exit
@@ -502,7 +640,7 @@ class Client:
         Raises:
             ValueError: Specified configuration profile does not exist
         '''
-        if profile not in self.config.get_profile_list():
+        if not self.config.profile_exists(profile):
             raise ValueError('Config profile \'' + profile + ' \' does not exist')
 
         self._previous_profile = profile
@@ -523,23 +661,51 @@ class Client:
     def _rx(self):
         '''Rx thread function.'''
         while self.online:
-            msg = self.js8call.get_next_message()
+            # block until a message is received, timeout allows the loop to exit when offline
+            msg = self.js8call.get_next_message(timeout = 0.5)
+
+            if msg is None:
+                continue
 
-            if msg is not None:
-                # incoming type callback
-                for callback in self.callback.incoming_type(msg.type):
-                    thread = threading.Thread(target=callback, args=[msg])
-                    thread.daemon = True
-                    thread.start()
+            # incoming type callback
+            for callback in self.callback.incoming_type(msg.type):
+                self._submit_callback(callback, msg)
 
-                # custom command callback
-                if msg.cmd is not None and msg.cmd in self.callback.commands:
-                    for callback in self.callback.commands[msg.cmd]:
-                        thread = threading.Thread(target=callback, args=[msg])
-                        thread.daemon = True
-                        thread.start()
+            # custom command callback
+            for callback in self.callback.commands.get(msg.cmd, ()):
+                self._submit_callback(callback, msg)
 
-            time.sleep(0.1)
+    def _submit_callback(self, callback, *args):
+        '''Run callback function for an incoming message.
+
+        Callbacks registered by pyjs8call modules (window, offset, time, and inbox monitors, notifications) run on their own thread, so timing sensitive internal handling never waits behind slow user callbacks. Other callbacks are queued for the callback worker threads.
+        '''
+        if (getattr(callback, '__module__', None) or '').startswith(_INTERNAL_MODULE_PREFIX):
+            thread = threading.Thread(target=callback, args=args)
+            thread.daemon = True
+            thread.start()
+        else:
+            self._callback_queue.put((callback, args))
+
+    @staticmethod
+    def _callback_worker(callback_queue):
+        '''Callback worker thread function.
+
+        Exceptions are printed so that one failing callback does not stop the worker.
+        '''
+        while True:
+            item = callback_queue.get()
+
+            # sentinel from stop
+            if item is None:
+                break
+
+            callback, args = item
+
+            try:
+                callback(*args)
+            except Exception:
+                traceback.print_exc()
 
     def connected(self):
         '''Get the state of the connection to the JS8Call application.
@@ -557,6 +723,7 @@ class Client:
         Returns:
             list: Configured callsign and custom groups
         '''
+        # groups are cached by the config handler until the config changes
         ids = self.config.get_groups()
         
         if hb and '@HB' not in ids:
@@ -615,7 +782,7 @@ class Client:
 
         # remove origin callsign
         # avoid other semicolons in message text
-        message = ':'.join(message.split(':')[1:]).strip()
+        message = message.partition(':')[2].strip()
 
         # handle no spaces between relay path and message text
         # avoid other relay character in message text
@@ -626,7 +793,7 @@ class Client:
             message = message[last_relay_index + 1:]
         else:
             # remove destination callsign or group
-            message = ' '.join(message.split(' ')[1:])
+            message = message.partition(' ')[2]
 
         # parse out custom commands
         space_after_cmd = message.find(' ', 1)
@@ -636,7 +803,7 @@ class Client:
             msg.set('cmd', cmd)
 
         # strip spaces and end-of-message symbol
-        message = message.strip(' ' + Message.EOM)
+        message = message.strip(_STRIP_CHARS)
 
         msg.set('text', message)
         return msg
@@ -767,19 +934,18 @@ class Client:
         
         # identify and handle commands in outgoing directed message
         if self.autodetect_outgoing_directed_command:
-            # sort decending by command length to avoid matching a partial command
-            msg_cmds = sorted(pyjs8call.Message.COMMANDS, key=len, reverse=True)
             message = message.upper()
-
-            for cmd in msg_cmds:
-                if message.startswith(cmd):
-                    cmd_found = True
-                    # preserve original message text
-                    message_text = message
-                    message = message.replace(cmd, '').strip()
-                    if len(message) == 0:
-                        message = None
-                    break
+            # skip the command scan unless the text starts with a possible command character
+            cmd_match = _COMMAND_RE.match(message) if message[:1] in _COMMAND_FIRST_CHARS else None
+
+            if cmd_match is not None:
+                cmd_found = True
+                cmd = cmd_match.group()
+                # preserve original message text
+                message_text = message
+                message = message[cmd_match.end():].strip()
+                if len(message) == 0:
+                    message = None
     
         # msg.type = Message.TX_SEND_MESSAGE by default
         if cmd_found:
@@ -872,8 +1038,8 @@ class Client:
         Returns:
             pyjs8call.message.Message: Constructed message object
         '''
-        phone = str(phone).replace('-', '').replace('.', '').replace('(', '').replace(')', '')
-        message = ':SMSGATE   :@' + phone + ' ' + message
+        phone = str(phone).translate(_PHONE_STRIP_TABLE)
+        message = ':SMSGATE   :@{} {}'.format(phone, message)
         return self.send_directed_command_message('@APRSIS', Message.CMD_CMD, message)
     
     def send_aprs_email(self, email, message):
@@ -890,7 +1056,7 @@ class Client:
         Returns:
             pyjs8call.message.Message: Constructed message object
         '''
-        message = ':EMAIL-2   :' + email + ' ' + message
+        message = ':EMAIL-2   :{} {}'.format(email, message)
         return self.send_directed_command_message('@APRSIS', Message.CMD_CMD, message)
     
     def send_aprs_pota_spot(self, park, freq, mode, message, callsign=None):
@@ -915,7 +1081,7 @@ class Client:
         if callsign is None:
             callsign = self.settings.get_station_callsign()
 
-        message = ':POTAGW   :' + callsign + ' ' + park + ' ' + str(freq) + ' ' + mode + ' ' + message
+        message = ':POTAGW   :{} {} {} {} {}'.format(callsign, park, freq, mode, message)
         return self.send_directed_command_message('@APRSIS', Message.CMD_CMD, message)
     
     def get_inbox_messages(self, unread=True):
@@ -954,7 +1120,8 @@ class Client:
         self.js8call.send(msg)
         messages = self.js8call.watch('inbox')
 
-        if messages is not None and len(messages) > 0 and unread:
+        # skip filtering when all messages are unread
+        if messages and unread and not all(map(_IS_UNREAD, messages)):
             messages = [msg for msg in messages if msg['unread']]
             
         return messages
@@ -1011,6 +1178,19 @@ class Client:
         msg.set('type', Message.INBOX_STORE_MESSAGE)
         msg.set('params', {'CALLSIGN': destination, 'TEXT': message})
         self.js8call.send(msg)
+        return msg
+
+    def store_local_inbox_message_and_fetch(self, destination, message):
+        '''Store local JS8Call inbox message and get inbox messages.
+
+        Args:
+            destination (str): Callsign to direct inbox message to
+            message (str): Message text to send
+
+        Returns:
+            list: Inbox messages, see *get_inbox_messages()* for details
+        '''
+        self.store_local_inbox_message(destination, message)
         time.sleep(self._set_get_delay)
         return self.get_inbox_messages()
 
@@ -1197,41 +1377,52 @@ class Client:
         if hearing_age is None:
             hearing_age = age # minutes
             
-        hearing = self.hearing(hearing_age)
-        heard_by = self.heard_by(hearing_age , hearing)
+        hearing, heard_by = self._hearing_and_heard_by(hearing_age)
         now = time.time()
 
-        for i in call_activity.copy():
-            activity = call_activity.pop(0)
+        # remove aged activity
+        if activity_age != 0:
+            call_activity = [activity for activity in call_activity if (now - activity['timestamp']) <= activity_age]
+
+        # grid square to (distance, distance units, bearing)
+        try:
+            grid_distances = self.grid_distances(activity['grid'].strip() for activity in call_activity)
+        except ValueError:
+            # local grid square not set
+            grid_distances = {}
+
+        # most recent spot per origin callsign
+        recent_spots = {}
+
+        for spot in reversed(self.spots.all()):
+            if activity_age != 0 and (now - spot.timestamp) > activity_age:
+                # spots are chronological, remaining spots are older
+                break
+
+            if spot.origin not in recent_spots:
+                recent_spots[spot.origin] = spot
+
+        for activity in call_activity:
             activity['origin'] = activity['origin'].strip()
             activity['grid'] = activity['grid'].strip()
             activity['distance'] = None
             activity['distance_units'] = None
             activity['bearing'] = None
 
-            # remove aged activity
-            if activity_age != 0 and (now - activity['timestamp']) > activity_age:
-                continue
-
-            activity['hearing'] = hearing[activity['origin']] if activity['origin'] in hearing else []
-            activity['heard_by'] = heard_by[activity['origin']] if activity['origin'] in heard_by else []
-
-            if activity['grid'] not in (None, ''):
-                try:
-                    distance, distance_units, bearing = self.grid_distance(activity['grid'])
-                    activity['distance'] = distance
-                    activity['distance_units'] = distance_units
-                    activity['bearing'] = bearing
-                except ValueError:
-                    pass
+            activity['hearing'] = hearing.get(activity['origin'], [])
+            activity['heard_by'] = heard_by.get(activity['origin'], [])
 
-            spot = self.spots.filter(origin = activity['origin'], age = activity_age, count = 1)
-            activity['speed'] = self.settings.submode_to_speed(spot[0].get('speed')) if len(spot) and isinstance(spot[0].get('speed'), int) else None
+            if activity['grid'] in grid_distances:
+                distance, distance_units, bearing = grid_distances[activity['grid']]
+                activity['distance'] = distance
+                activity['distance_units'] = distance_units
+                activity['bearing'] = bearing
 
-            call_activity.append(activity)
+            spot = recent_spots.get(activity['origin'].upper())
+            activity['speed'] = self.settings.submode_to_speed(spot.get('speed')) if spot is not None and isinstance(spot.get('speed'), int) else None
 
         # sort by most recent first
-        call_activity.sort(key = lambda activity: activity['timestamp'], reverse = True)
+        call_activity.sort(key = _BY_TIMESTAMP, reverse = True)
         return call_activity
         
     def get_call_activity_from_spots(self, age=None, hearing_age=None):
@@ -1271,34 +1462,34 @@ class Client:
             age = self.config.get('Configuration', 'CallsignAging', int)
         
         spot_age = age * 60 # minutes to seconds
-        spots = self.spots.filter(age = spot_age)
         
         if hearing_age is None:
             hearing_age = spot_age # seconds
         else:
             hearing_age = hearing_age * 60 # minutes to seconds
         
-        call_activity = []
-        call_activity_origins = []
+        # origin to activity, keeps only most recent activity for each origin
+        call_activity = {}
         call_activity_grids = {}
         hearing_spots = []
+        now = time.time()
 
         # improve performance by processing all spots only once,
         # instead of multiple times by calling pre-built functions such as client.spots.filter and client.hearing (without passing spots)
-        for spot in self.spots.all():
+        # spots are stored in the order received, process most recent first
+        for spot in reversed(self.spots.all()):
             # map origins to grid squares for later use
             # keep only most recent grid square for each origin
             if spot.origin not in (None, '') and spot.origin not in call_activity_grids and spot.grid not in (None, ''):
                 call_activity_grids[spot.origin] = (spot.grid, spot.distance, spot.distance_units, spot.bearing)
 
             # spot age is seconds
-            if spot.age() <= hearing_age:
+            elapsed = now - spot.timestamp
+
+            if elapsed <= hearing_age:
                 hearing_spots.append(spot)
                 
-            if spot.age() <= spot_age and spot.origin not in call_activity_origins:
-                # track origins to keep only most recent activity for each origin
-                call_activity_origins.append(spot.origin)
-
+            if elapsed <= spot_age and spot.origin not in call_activity:
                 activity = {}
                 activity['origin'] = spot.origin
                 activity['grid'] = spot.grid
@@ -1309,28 +1500,30 @@ class Client:
                 activity['distance'] = spot.distance
                 activity['distance_units'] = spot.distance_units
                 activity['bearing'] = spot.bearing
-                activity['speed'] = self.settings.submode_to_speed(spot.speed) if spot.speed is not None else None
+                activity['speed'] = self.settings.submode_to_speed(spot.speed) if isinstance(spot.speed, int) else None
 
-                call_activity.append(activity)
+                call_activity[spot.origin] = activity
 
+        # process hearing spots in the order received
+        hearing_spots.reverse()
         # convert seconds to minutes
-        hearing = self.hearing(hearing_age / 60, hearing_spots)
-        heard_by = self.heard_by(hearing_age / 60, hearing)
+        hearing, heard_by = self._hearing_and_heard_by(hearing_age / 60, hearing_spots)
 
-        for i in range(len(call_activity)):
+        for origin, activity in call_activity.items():
             # get grid squares that were reported before *spot_age*
-            if call_activity[i]['grid'] in (None, '') and call_activity[i]['origin'] in call_activity_grids:
-                grid, distance, distance_units, bearing = call_activity_grids[call_activity[i]['origin']]
-                call_activity[i]['grid'] = grid
-                call_activity[i]['distance'] = distance
-                call_activity[i]['distance_units'] = distance_units
-                call_activity[i]['bearing'] = bearing
-
-            call_activity[i]['hearing'] = hearing[call_activity[i]['origin']] if call_activity[i]['origin'] in hearing else []
-            call_activity[i]['heard_by'] = heard_by[call_activity[i]['origin']] if call_activity[i]['origin'] in heard_by else []
+            if activity['grid'] in (None, '') and origin in call_activity_grids:
+                grid, distance, distance_units, bearing = call_activity_grids[origin]
+                activity['grid'] = grid
+                activity['distance'] = distance
+                activity['distance_units'] = distance_units
+                activity['bearing'] = bearing
+
+            activity['hearing'] = hearing.get(origin, [])
+            activity['heard_by'] = heard_by.get(origin, [])
             
+        call_activity = list(call_activity.values())
         # sort by most recent first
-        call_activity.sort(key = lambda activity: activity['timestamp'], reverse = True)
+        call_activity.sort(key = _BY_TIMESTAMP, reverse = True)
         return call_activity
 
     def get_band_activity(self, age=None):
@@ -1376,15 +1569,9 @@ class Client:
 
         if age is not None:
             # remove aged activity
-            for i in band_activity.copy():
-                activity = band_activity.pop(0)
+            band_activity = [activity for activity in band_activity if (now - activity['timestamp']) <= age]
 
-                if (now - activity['timestamp']) > age:
-                    continue
-
-                band_activity.append(activity)
-
-        band_activity.sort(key=lambda activity: activity['offset'])
+        band_activity.sort(key=_BY_OFFSET)
         return band_activity
 
     def get_selected_call(self):
@@ -1475,29 +1662,22 @@ class Client:
         '''
         # rx message structure:
         # hh:mm:ss - (offset) - text
-        #   [0]        [1]      [2]
-        #    ^ index when split on '-'
 
         rx_text = self.get_rx_text()
         callsign = self.settings.get_station_callsign()
-        msgs = rx_text.split('\n\n')
-        msgs = [msg.strip(' ' + Message.EOM) for msg in msgs if len(msg.strip()) > 0]
-
         rx_messages = []
-        for msg in msgs:
-            # check for first dash and opening offset parenthesis to avoid processing malformed text 
-            # this string avoids finding negative SNR values in message text
-            if ' - (' not in msg:
+
+        for msg in rx_text.split('\n\n'):
+            # skip blank and malformed text
+            msg_match = _RX_MSG_RE.match(msg.strip(_STRIP_CHARS))
+
+            if msg_match is None:
                 continue
 
-            # limit splits to avoid splitting message text
-            # 2 splits = 3 parts (timestamp, offset, text)
-            parts = msg.split('-', maxsplit=2)
-            
             data = {}
-            data['time'] = parts[0].strip()
-            data['offset'] = int(parts[1].strip(' \n()'))
-            data['text'] = parts[2].strip()
+            data['time'] = msg_match.group(1).strip()
+            data['offset'] = int(msg_match.group(2))
+            data['text'] = msg_match.group(3).strip()
             data['origin'] = None
             data['destination'] = None
 
@@ -1508,36 +1688,30 @@ class Client:
                 #
                 # free text with only origin falls through with no further processing
 
-                directed_parts = data['text'].split(':')
-                data['origin'] = directed_parts[0].strip()
-                data['text'] = directed_parts[1].strip()
-                first_space = data['text'].find(' ')
+                origin, _, text = data['text'].partition(':')
+                data['origin'] = origin.strip()
 
-                # double space
-                if '  ' in data['text']:
-                    # directed message without command
-                    directed_parts = data['text'].split('  ')
-                    data['destination'] = directed_parts[0].strip()
-                    data['text'] = directed_parts[1].strip()
+                # skip outgoing messages before parsing destination
+                if not own and data['origin'] == callsign:
+                    continue
 
-                elif first_space > 0:
-                    # directed message with command
-                    destination = data['text'][:first_space].strip()
-                    # do not strip whitespace here, this removes leading space in command string
-                    text = data['text'][first_space:]
+                data['text'] = text.strip()
+                directed_match = _RX_DIRECTED_RE.match(data['text'])
 
-                    # look for command at begining of text to confirm destination/text split is correct
-                    commands = Message.COMMANDS.copy()
-                    commands.remove(Message.CMD_FREETEXT)
-                    commands.remove(Message.CMD_FREETEXT_2)
+                if directed_match is None:
+                    # free text
+                    pass
 
-                    for cmd in commands:
-                        if text.find(cmd) == 0:
-                            data['destination'] = destination
-                            data['text'] = text
+                elif directed_match.group(1) is not None:
+                    # directed message without command
+                    data['destination'] = directed_match.group(1).strip()
+                    data['text'] = directed_match.group(2).strip()
 
-            if not own and data['origin'] == callsign:
-                continue
+                else:
+                    # directed message with command
+                    data['destination'] = directed_match.group(3).strip()
+                    # do not strip whitespace here, this removes leading space in command string
+                    data['text'] = directed_match.group(4)
 
             rx_messages.append(data)
 
@@ -1555,104 +1729,174 @@ class Client:
             dict: Example format `{'station': ['station', ...], ...}`
             spots: Spots to process (ex. from pyjs8call.spotmonitor.SpotMonitor.filter), defaults to None
         '''
+        return self._hearing_and_heard_by(age, spots)[0]
+
+    def station_hearing(self, station=None, age=None):
+        '''Stations the specified station is hearing.
+        
+        See Client.hearing for more information.
+
+        Args:
+            station (str): Station callsign to get hearing data for, defaults to local station callsign
+            age (int): Maximum message age in minutes, defaults to JS8Call callsign activity aging
+
+        Returns:
+            list: Station callsigns the specified station is hearing
+        '''
+        if station is None:
+            station = self.settings.get_station_callsign()
+
+        return self._station_hearing_and_heard_by(station, age)[0]
+    
+    def heard_by(self, age=None, hearing=None):
+        '''Stations other stations are heard by.
+
+        Client.heard_by is the inverse of Client.hearing.
+
+        If calling both Client.hearing and Client.heard_by, it is more efficient to pass the result of Client.hearing to Client.heard_by. Otherwise, Client.heard_by() will process spots again internally.
+
+        Args:
+            age (int): Maximum message age in minutes, defaults to JS8Call callsign activity aging
+            hearing (dict): Result of Client.hearing, defaults to result of Client.hearing
+
+        Returns:
+            dict: Example format `{'station': ['station', ...], ...}`
+        '''
+        if hearing is None:
+            return self._hearing_and_heard_by(age)[1]
+
+        heard_by = {}
+
+        for key, value in hearing.items():
+            for callsign in value:
+                heard_by.setdefault(callsign, set()).add(key)
+
+        return {station: list(stations) for station, stations in heard_by.items()}
+
+    def _hearing_and_heard_by(self, age=None, spots=None):
+        '''Stations other stations are hearing and are heard by.
+
+        Builds the results of Client.hearing and Client.heard_by in a single pass over spots.
+
+        Args:
+            age (int): Maximum message age in minutes, defaults to JS8Call callsign activity aging
+            spots: Spots to process (ex. from pyjs8call.spotmonitor.SpotMonitor.filter), defaults to None
+
+        Returns:
+            tuple (dict, dict): Hearing and heard by, see Client.hearing and Client.heard_by
+        '''
         if age is None:
             age = self.config.get('Configuration', 'CallsignAging', int)
 
         age *= 60 # minutes to seconds
             
         callsign = self.settings.get_station_callsign()
+        # station sets avoid linear membership checks, converted to lists on return
         hearing = {}
+        heard_by = {}
 
         if spots is None:
             spots = self.spots.filter(age = age)
+
+        # stations the local station is hearing, merged into hearing after processing spots
+        local_hearing = set()
         
         for spot in spots:
             # stations we are hearing
-            if callsign not in hearing:
-                hearing[callsign] = [spot.origin]
-            elif spot.origin not in hearing[callsign]:
-                hearing[callsign].append(spot.origin)
+            local_hearing.add(spot.origin)
+            heard_by.setdefault(spot.origin, set()).add(callsign)
                 
             # only process msgs with directed commands
             if spot.cmd is None:
                 continue
 
             if spot.cmd == Message.CMD_HEARING and spot.hearing is not None:
-                if spot.origin not in hearing:
-                    hearing[spot.origin] = spot.hearing
-                else:
-                    spot_hearing = [station for station in spot.hearing if station not in hearing[spot.origin]]
-                    hearing[spot.origin].extend(spot_hearing)
+                hearing.setdefault(spot.origin, set()).update(spot.hearing)
+
+                for station in spot.hearing:
+                    heard_by.setdefault(station, set()).add(spot.origin)
             
-            if spot.cmd in Message.AUTOREPLY_COMMANDS:
-                if spot.origin not in hearing:
-                    hearing[spot.origin] = []
+            if spot.cmd in _AUTOREPLY_COMMANDS:
+                origin_hearing = hearing.setdefault(spot.origin, set())
 
                 if isinstance(spot.path, list):
                     # handle relay path
-                    relay_path = Message.CMD_RELAY.join(spot.path)
+                    station = Message.CMD_RELAY.join(spot.path)
 
-                    if relay_path not in hearing[spot.origin]:
-                        hearing[spot.origin].append(relay_path)
+                elif spot.destination != '@ALLCALL':
+                    station = spot.destination
 
-                elif spot.destination != '@ALLCALL' and spot.destination not in hearing[spot.origin]:
-                    hearing[spot.origin].append(spot.destination)
+                else:
+                    continue
 
-        return hearing
+                origin_hearing.add(station)
+                heard_by.setdefault(station, set()).add(spot.origin)
 
-    def station_hearing(self, station=None, age=None):
-        '''Stations the specified station is hearing.
-        
-        See Client.hearing for more information.
+        if local_hearing:
+            hearing.setdefault(callsign, set()).update(local_hearing)
+
+        hearing = {station: list(stations) for station, stations in hearing.items()}
+        heard_by = {station: list(stations) for station, stations in heard_by.items()}
+        return (hearing, heard_by)
+
+    def _station_hearing_and_heard_by(self, station, age=None):
+        '''Stations the specified station is hearing and is heard by.
+
+        Same as the *station* entries of Client.hearing and Client.heard_by, without building entries for all other stations.
 
         Args:
-            station (str): Station callsign to get hearing data for, defaults to local station callsign
+            station (str): Station callsign to get hearing and heard by data for
             age (int): Maximum message age in minutes, defaults to JS8Call callsign activity aging
 
         Returns:
-            list: Station callsigns the specified station is hearing
+            tuple (list, list): Station callsigns the specified station is hearing and is heard by
         '''
-        hearing = self.hearing(age)
+        if age is None:
+            age = self.config.get('Configuration', 'CallsignAging', int)
 
-        if station is None:
-            station = self.settings.get_station_callsign()
+        age *= 60 # minutes to seconds
 
-        if station in hearing:
-            return hearing[station]
-        else:
-            return []
-    
-    def heard_by(self, age=None, hearing=None):
-        '''Stations other stations are heard by.
+        callsign = self.settings.get_station_callsign()
+        hearing = set()
+        heard_by = set()
 
-        Client.heard_by is the inverse of Client.hearing.
+        for spot in self.spots.filter(age = age):
+            # stations we are hearing
+            if callsign == station:
+                hearing.add(spot.origin)
 
-        If calling both Client.hearing and Client.heard_by, it is more efficient to pass the result of Client.hearing to Client.heard_by. Otherwise, Client.heard_by() will call Client.hearing again internally.
+            if spot.origin == station:
+                heard_by.add(callsign)
 
-        Args:
-            age (int): Maximum message age in minutes, defaults to JS8Call callsign activity aging
-            hearing (dict): Result of Client.hearing, defaults to result of Client.hearing
+            # only process msgs with directed commands
+            if spot.cmd is None:
+                continue
 
-        Returns:
-            dict: Example format `{'station': ['station', ...], ...}`
-        '''
-        if age is None:
-            age = self.config.get('Configuration', 'CallsignAging', int)
-        
-        age *= 60
-        heard_by = {}
+            if spot.cmd == Message.CMD_HEARING and spot.hearing is not None:
+                if spot.origin == station:
+                    hearing.update(spot.hearing)
 
-        if hearing is None:
-            hearing = self.hearing(age)
+                if station in spot.hearing:
+                    heard_by.add(spot.origin)
 
-        for key, value in hearing.items():
-            for callsign in value:
-                if callsign not in heard_by:
-                    heard_by[callsign] = [key]
-                elif key not in heard_by[callsign]:
-                    heard_by[callsign].append(key)
+            if spot.cmd in _AUTOREPLY_COMMANDS:
+                if isinstance(spot.path, list):
+                    # handle relay path
+                    heard = Message.CMD_RELAY.join(spot.path)
+
+                elif spot.destination != '@ALLCALL':
+                    heard = spot.destination
+
+                else:
+                    continue
+
+                if spot.origin == station:
+                    hearing.add(heard)
 
-        return heard_by
+                if heard == station:
+                    heard_by.add(spot.origin)
+
+        return (list(hearing), list(heard_by))
 
     def station_heard_by(self, station=None, age=None, hearing=None):
         '''Stations the specified station is heard by.
@@ -1667,15 +1911,13 @@ class Client:
         Returns:
             list: Station callsigns heard by the specified station
         '''
-        heard_by = self.heard_by(age, hearing)
-
         if station is None:
             station = self.settings.get_station_callsign()
 
-        if station in heard_by:
-            return heard_by[station]
-        else:
-            return []
+        if hearing is None:
+            return self._station_hearing_and_heard_by(station, age)[1]
+
+        return [key for key, value in hearing.items() if station in value]
 
 #    def discover_path(self, destination, age=60):
 #        '''
@@ -1715,38 +1957,95 @@ class Client:
         Raises:
             ValueError: *grid_b* is *None* and JS8Call grid square is not set
         '''
-        earth_radius_km = 6371
-        earth_radius_mi = 3958.756
+        if grid_b is None:
+            grid_b = self.settings.get_station_grid()
+
+        if grid_b in (None, ''):
+            raise ValueError('Second grid square required, JS8Call grid square not set.')
+
+        lat_b, lon_b = map(radians, self.grid_to_lat_lon(grid_b))
+
+        if self.settings.get_distance_units_miles():
+            earth_radius = _EARTH_RADIUS_MI
+            units = 'mi'
+        else:
+            earth_radius = _EARTH_RADIUS_KM
+            units = 'km'
+
+        distance, bearing = self._great_circle(grid_a, sin(lat_b), cos(lat_b), lon_b, earth_radius)
+        return (distance, units, bearing)
+
+    def grid_distances(self, grids, grid_b=None):
+        '''Calculate great circle distance and bearing between many grid squares and one grid square.
+
+        Equivalent to calling Client.grid_distance for each grid square in *grids*, except that *grid_b* and the JS8Call distance units are only processed once. Duplicate grid squares are calculated once.
+
+        Args:
+            grids (list): Grid squares to calculate distance and bearing for
+            grid_b (str): Second grid square, defaults to JS8Call grid square
 
+        Returns:
+            dict: Grid square to *tuple (int, str, int)* distance, distance units, and bearing mapping (see Client.grid_distance). Invalid grid squares map to *(None, None, None)*.
+
+        Raises:
+            ValueError: *grid_b* is *None* and JS8Call grid square is not set
+        '''
         if grid_b is None:
             grid_b = self.settings.get_station_grid()
 
         if grid_b in (None, ''):
             raise ValueError('Second grid square required, JS8Call grid square not set.')
 
-        lat_a, lon_a = self.grid_to_lat_lon(grid_a)
-        lat_b, lon_b = self.grid_to_lat_lon(grid_b)
-        # convert degrees to radians
-        lat_a, lon_a, lat_b, lon_b = map(radians, [lat_a, lon_a, lat_b, lon_b])
+        lat_b, lon_b = map(radians, self.grid_to_lat_lon(grid_b))
+        sin_lat_b, cos_lat_b = sin(lat_b), cos(lat_b)
 
-        # calculate great circle distance
-        gcd = acos(sin(lat_a) * sin(lat_b) + cos(lat_a) * cos(lat_b) * cos(lon_b - lon_a))
-        
         if self.settings.get_distance_units_miles():
-            distance = int(round(earth_radius_mi * gcd, 0))
+            earth_radius = _EARTH_RADIUS_MI
             units = 'mi'
         else:
-            distance = int(round(earth_radius_km * gcd, 0))
+            earth_radius = _EARTH_RADIUS_KM
             units = 'km'
 
+        distances = {}
+
+        for grid in grids:
+            if grid in distances:
+                continue
+
+            try:
+                distance, bearing = self._great_circle(grid, sin_lat_b, cos_lat_b, lon_b, earth_radius)
+                distances[grid] = (distance, units, bearing)
+            except ValueError:
+                distances[grid] = (None, None, None)
+
+        return distances
+
+    def _great_circle(self, grid_a, sin_lat_b, cos_lat_b, lon_b, earth_radius):
+        '''Calculate great circle distance and bearing from *grid_b* to *grid_a*.
+
+        *grid_b* latitude trig values and longitude (in radians) are passed in so they can be reused across calls.
+
+        Returns:
+            tuple (int, int): Distance in units of *earth_radius* and bearing in degrees
+        '''
+        lat_a, lon_a = map(radians, self.grid_to_lat_lon(grid_a))
+
+        # trig values shared by distance and bearing calculations
+        sin_lat_a, cos_lat_a = sin(lat_a), cos(lat_a)
+        sin_dlon, cos_dlon = sin(lon_a - lon_b), cos(lon_a - lon_b)
+
+        # calculate great circle distance
+        gcd = acos(sin_lat_a * sin_lat_b + cos_lat_a * cos_lat_b * cos_dlon)
+        distance = int(round(earth_radius * gcd, 0))
+
         # calculate bearing
-        y = sin(lon_a - lon_b) * cos(lat_a)
-        x = cos(lat_b) * sin(lat_a) - sin(lat_b) * cos(lat_a) * cos(lon_a - lon_b)
+        y = sin_dlon * cos_lat_a
+        x = cos_lat_b * sin_lat_a - sin_lat_b * cos_lat_a * cos_dlon
         angle = atan2(y, x)
         bearing = (angle * 180 / pi + 360) % 360
         bearing = int(round(bearing, 0))
 
-        return (distance, units, bearing)
+        return (distance, bearing)
 
     def grid_to_lat_lon(self, grid):
         '''Convert grid square to latitude/longitude.
@@ -1774,40 +2073,70 @@ class Client:
 
         grid = grid.upper()
 
-        field_map = ['A','B','C','D','E','F','G','H','I','J','K','L','M','N','O','P','Q','R']
-        sub_square_map = ['A','B','C','D','E','F','G','H','I','J','K','L','M','N','O','P','Q','R','S','T','U','V','W','X']
-        field_lon_deg = 20
-        field_lat_deg = 10
-        square_lon_deg = 2
-        square_lat_deg = 1
-        sub_square_lon_deg = 1/12
-        sub_square_lat_deg = 1/24
-
-        grid_lon = [grid[i] for i in range(0, len(grid), 2)]
-        grid_lat = [grid[i] for i in range(1, len(grid), 2)]
-
+        # grid characters alternate longitude and latitude: field, square, sub-square
         try:
-            lon = field_map.index(grid_lon[0]) * field_lon_deg
-            lon += int(grid_lon[1]) * square_lon_deg
+            lon = _GRID_FIELD_INDEX[grid[0]] * _GRID_FIELD_LON_DEG
+            lon += int(grid[2]) * _GRID_SQUARE_LON_DEG
 
-            if len(grid_lon) == 3:
-                lon += sub_square_map.index(grid_lon[2]) * sub_square_lon_deg
+            if len(grid) == 6:
+                lon += _GRID_SUB_SQUARE_INDEX[grid[4]] * _GRID_SUB_SQUARE_LON_DEG
 
             lon -= 180
             lon = round(lon, 3)
 
-            lat = field_map.index(grid_lat[0]) * field_lat_deg
-            lat += int(grid_lat[1]) * square_lat_deg
+            lat = _GRID_FIELD_INDEX[grid[1]] * _GRID_FIELD_LAT_DEG
+            lat += int(grid[3]) * _GRID_SQUARE_LAT_DEG
 
-            if len(grid_lat) == 3:
-                lat += sub_square_map.index(grid_lat[2]) * sub_square_lat_deg
+            if len(grid) == 6:
+                lat += _GRID_SUB_SQUARE_INDEX[grid[5]] * _GRID_SUB_SQUARE_LAT_DEG
 
             lat -= 90
             lat = round(lat, 3)
 
-        except ValueError as e:
+        except (KeyError, ValueError) as e:
             raise ValueError('Invalid grid square format. Field and sub-square must be letters A-R '
                              '(case insensitive), and square must be numbers 0-9 (ex. EM19es).') from e
 
         return (lat, lon)
 
+
+# band tables built from a plain dict assigned to Client.BANDS, and a copy of the dict they were built from
+_BAND_TABLES = {}
+
+
+def _band_tables(bands):
+    '''Get parallel band tables sorted by minimum frequency.
+
+    Tables for the default band dictionary are stored on it and dropped when it is edited. If Client.BANDS is
+    replaced with a plain dict, edits cannot be tracked, so a copy of the dict is compared on each call instead.
+
+    Args:
+        bands (dict): Client.BANDS
+
+    Returns:
+        tuple: Format `(min_freqs, max_freqs, names)`
+    '''
+    if not isinstance(bands, _BandDict):
+        cached = _BAND_TABLES.get('plain')
+
+        if cached is not None and cached[0] == bands:
+            return cached[1]
+
+    version = getattr(bands, 'version', None)
+    band_ranges = sorted((freqs[0], freqs[1], band) for band, freqs in bands.items() if band != Client.OOB)
+    min_freqs = array('q', [band_range[0] for band_range in band_ranges])
+    max_freqs = array('q', [band_range[1] for band_range in band_ranges])
+    names = tuple(band_range[2] for band_range in band_ranges)
+    tables = (min_freqs, max_freqs, names)
+
+    if isinstance(bands, _BandDict):
+        bands.tables = tables
+
+        # drop tables built while another thread edited the dict
+        if bands.version != version:
+            bands.tables = None
+    else:
+        # replaced as a whole so concurrent lookups never see a mismatched copy and tables
+        _BAND_TABLES['plain'] = (dict(bands), tables)
+
+    return tables
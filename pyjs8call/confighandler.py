@@ -80,6 +80,13 @@ class ConfigHandler:
         '''JS8Call configuration container (see python3 configparser for more information)'''
         self.rig = None
         '''str: Rig name passed to JS8Call at application launch, defaults to None'''
+        # whether the config object has changed since the last write
+        self._modified = False
+        # profile names cache, rebuilt on first use after profiles change
+        self._profile_list = None
+        self._profile_set = None
+        # callsign groups cache, rebuilt on first use after the config changes
+        self._groups = None
 
         if config_path is not None:
             self.path, self.file = os.path.split(config_path)
@@ -122,12 +129,22 @@ class ConfigHandler:
         self.config = configparser.ConfigParser(interpolation = None)
         self.config.optionxform = lambda option: option
         self.config.read(self.config_path)
+        self._profile_list = None
+        self._groups = None
 
-    def write(self):
+    def write(self, force=False):
         '''Write the config parser object to file.
 
         A backup of the original JS8Call config file is saved as JS8Call.ini.original in the same directory as the JS8Call.ini file. Rig specific config file backups are not saved.
+
+        The file is only written if the config object was modified via this handler since the last write, unless *force* is True.
+
+        Args:
+            force (bool): Write the file even if no changes were made, defaults to False
         '''
+        if not self._modified and not force:
+            return
+
         if self.rig is None and not os.path.exists(self.config_path + '.original'):
             # create a backup of the original config file before writing changes
             with open(self.config_path + '.original', 'w') as fd:
@@ -137,6 +154,8 @@ class ConfigHandler:
             # write current config object to the config file
             self.config.write(fd, space_around_delimiters = False)
 
+        self._modified = False
+
     def set(self, section, option, value):
         '''Set an option value in a given section.
 
@@ -161,7 +180,10 @@ class ConfigHandler:
             TypeError: Option value is a type other than str, int, float, or bool
         '''
         try:
-            self.config.set(section, option, str(value))
+            if self.config.get(section, option, fallback=None) != str(value):
+                self.config.set(section, option, str(value))
+                self._groups = None
+                self._modified = True
         except configparser.NoSectionError as e:
             raise RuntimeError('JS8Call config file section \'' + str(section) + '\' does not exist.') from e
             
@@ -197,12 +219,27 @@ class ConfigHandler:
         elif value_type is bool:
             return self.config.getboolean(section, option, fallback=fallback)
 
+    def get_section(self, section):
+        '''Get all option values from a given section.
+
+        Args:
+            section (str): Name of the section to get options from
+
+        Returns:
+            dict: Option names mapped to string values, or an empty dict if the specified section does not exist
+        '''
+        if not self.config.has_section(section):
+            return {}
+
+        return dict(self.config.items(section))
+
     def clear_call_activity(self):
         '''Clear JS8Call call activity.
 
         This removes the section *CallActivity* from the config file.
         '''
-        self.config.remove_section('CallActivity')
+        if self.config.remove_section('CallActivity'):
+            self._modified = True
 
     def get_active_profile(self):
         '''Get active JS8Call configuration profile.
@@ -218,21 +255,40 @@ class ConfigHandler:
         Returns:
             list: List of profiles in the configuration file
         '''
-        profiles = []
-        profiles.append(self.get_active_profile())
+        if self._profile_list is None:
+            profiles = [self.get_active_profile()]
+            profile_set = set(profiles)
 
-        for option in self.config.options('MultiSettings'):
-            option_parts = option.split('\\')
+            for option in self.config.options('MultiSettings'):
+                option_parts = option.split('\\', 1)
 
-            if len(option_parts) == 1:
-                continue
+                if len(option_parts) == 1:
+                    continue
 
-            profile_name = option_parts[0]
+                profile_name = option_parts[0]
+
+                if profile_name not in profile_set:
+                    profiles.append(profile_name)
+                    profile_set.add(profile_name)
+
+            self._profile_set = profile_set
+            self._profile_list = profiles
+
+        return self._profile_list.copy()
+
+    def profile_exists(self, profile):
+        '''Whether a JS8Call configuration profile exists.
+
+        Args:
+            profile (str): Name of the configuration profile
 
-            if profile_name not in profiles:
-                profiles.append(profile_name)
+        Returns:
+            bool: True if the specified profile exists, False otherwise
+        '''
+        if self._profile_list is None:
+            self.get_profile_list()
 
-        return profiles
+        return profile in self._profile_set
 
     def get_profile_options(self, profile):
         '''Get all options and values for a configuration profile.
@@ -244,7 +300,7 @@ class ConfigHandler:
             A dictionary of the following structure:
                 dict[section][option] = value
         '''
-        if profile not in self.get_profile_list():
+        if not self.profile_exists(profile):
             raise Exception('Profile ' + profile + ' does not exist')
 
         options = {}
@@ -290,7 +346,7 @@ class ConfigHandler:
         Returns:
             The value of the specified option in the specified section in the specified profile as the specified type, or the fallback value if the option is not found.
         '''
-        if profile not in self.get_profile_list():
+        if not self.profile_exists(profile):
             raise Exception('Profile ' + profile + ' does not exist')
 
         option = profile + '\\' + section + '\\' + option
@@ -317,7 +373,7 @@ class ConfigHandler:
         Returns:
             str: Value of the specified option in the specified section of the specified profile, or None if value is a type other than those listed above
         '''
-        if profile not in self.get_profile_list():
+        if not self.profile_exists(profile):
             raise Exception('Profile ' + profile + ' does not exist')
 
         option = profile + '\\' + section + '\\' + option
@@ -333,7 +389,7 @@ class ConfigHandler:
         Raises:
             ValueError: Specified profile does not exist
         '''
-        if new_profile not in self.get_profile_list():
+        if not self.profile_exists(new_profile):
             raise ValueError('Profile ' + new_profile + ' does not exist')
 
         active_profile = self.get_active_profile()
@@ -356,6 +412,9 @@ class ConfigHandler:
                 self.config.remove_option('MultiSettings', new_profile_option)
 
         self.set('MultiSettings', 'CurrentName', new_profile)
+        self._profile_list = None
+        self._groups = None
+        self._modified = True
 
     def create_new_profile(self, new_profile, copy_profile='Default'):
         '''Create new JS8Call configuration profile.
@@ -367,7 +426,7 @@ class ConfigHandler:
         Raises:
             Exception: Specified profile to be copied does not exist
         '''
-        if copy_profile not in self.get_profile_list():
+        if not self.profile_exists(copy_profile):
             raise Exception('Profile ' + copy_profile + ' cannot be copied because it does not exist')
 
         active_profile = self.get_active_profile()
@@ -391,6 +450,9 @@ class ConfigHandler:
                     new_profile_option = new_profile + '\\' + section + '\\' + option
                     self.config.set('MultiSettings', new_profile_option, str(value))
 
+        self._profile_list = None
+        self._modified = True
+
     def remove_profile(self, profile):
         '''Remove an existing JS8Call configuration profile.
 
@@ -400,7 +462,7 @@ class ConfigHandler:
         Raises:
             Exception: Specified profile does not exist
         '''
-        if profile not in self.get_profile_list():
+        if not self.profile_exists(profile):
             raise Exception('Profile ' + profile + ' does not exist')
 
         profile_options = self.get_profile_options(profile)
@@ -410,18 +472,22 @@ class ConfigHandler:
                 profile_option = profile + '\\' + section + '\\' + option
                 self.config.remove_option('MultiSettings', profile_option)
 
+        self._profile_list = None
+        self._modified = True
+
     def get_groups(self):
         '''Get list of JS8Call callsign groups.
 
         Returns:
             list: List of callsign groups
         '''
-        groups = self.config.get('Configuration', 'MyGroups')
-        groups = groups.split(',')
-        # strip spaces, ensure a single @ symbol
-        groups = ['@' + group.strip(' @') for group in groups if len(group.strip()) > 0]
+        if self._groups is None:
+            groups = self.config.get('Configuration', 'MyGroups')
+            groups = groups.split(',')
+            # strip spaces, ensure a single @ symbol
+            self._groups = tuple('@' + group.strip(' @') for group in groups if len(group.strip()) > 0)
         
-        return groups
+        return list(self._groups)
 
     def add_group(self, group):
         '''Add a new JS8Call callsign group.
@@ -440,6 +506,8 @@ class ConfigHandler:
             groups = ','.join(groups)
 
             self.config.set('Configuration', 'MyGroups', groups)
+            self._groups = None
+            self._modified = True
 
     def remove_group(self, group):
         '''Remove an existing JS8Call callsign group.
@@ -456,4 +524,6 @@ class ConfigHandler:
             groups = ['@' + group for group in groups if group != remove_group]
             groups = ', '.join(groups)
             self.config.set('Configuration', 'MyGroups', groups)
+            self._groups = None
+            self._modified = True
 
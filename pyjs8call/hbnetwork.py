@@ -59,6 +59,10 @@ class HeartbeatNetworking:
         self._paused = False
         self._offset = None
         self._outgoing_msg = None
+        self._outgoing_msg_event = threading.Event()
+        # set while disabled, interrupts monitor thread waits
+        self._disabled = threading.Event()
+        self._disabled.set()
 
     def enabled(self):
         '''Get enabled status.
@@ -85,6 +89,7 @@ class HeartbeatNetworking:
         # heartbeat acknowledgements only function if heartbeat networking is enabled
         self._client.settings.enable_heartbeat_networking()
         self._enabled = True
+        self._disabled.clear()
 
         self._offset = OffsetMonitor(self._client, hb = True)
         self._offset.min_offset = 500
@@ -101,6 +106,9 @@ class HeartbeatNetworking:
     def disable(self):
         '''Disable heartbeat networking.'''
         self._enabled = False
+        self._disabled.set()
+        # wake the monitor thread if waiting for heartbeat status
+        self._outgoing_msg_event.set()
         
         if self._offset is not None:
             self._offset.disable()
@@ -123,11 +131,13 @@ class HeartbeatNetworking:
             msg (pyjs8call.Message): outgoing message object
         '''
         self._outgoing_msg = msg
+        self._outgoing_msg_event.set()
 
     def _monitor(self):
         '''Heartbeat interval monitor thread.'''
         while self._enabled:
-            time.sleep(1)
+            if self._disabled.wait(1):
+                return
             
             # wait for accurate window timing
             if self._client.window.next_transition_seconds() is None:
@@ -145,21 +155,29 @@ class HeartbeatNetworking:
             # subtract window duration to prevent bumping to next window after interval
             interval -= self._client.settings.get_window_duration() + 1 # 1 = offset monitor before-transition time
 
+            now = time.time()
+            # hb interval has not passed since last outgoing msg or last band change (including start) until this time
+            next_hb = max(self._client.js8call.last_outgoing, self._client.js8call.last_band_change) + interval
+
+            if next_hb > now:
+                # wait until hb interval passes instead of checking every rx/tx window,
+                # limit wait time to pick up interval changes from config
+                if self._disabled.wait(min(next_hb - now, 60)):
+                    return
+
+                continue
+
             # update heartbeat during qso from config
             pause_heartbeat_during_qso = self._client.settings.heartbeat_during_qso_paused()
             # whether callsign is selected on js8call ui
             callsign_selected = not self._client.get_selected_call() is None
 
-            now = time.time()
-
             # skip heartbeating in the following cases:
             if (
                 self._paused or
                 self._client.settings.get_speed() == 'turbo' or # no hb in turbo mode
                 (pause_heartbeat_during_qso and callsign_selected) or # callsign selected on js8call ui
-                self._client.js8call.activity(age = interval) or # recent activity, including text in the text box and queued outgoing msgs
-                (self._client.js8call.last_outgoing + interval) > now or # hb interval has not passed since last outgoing msg
-                (self._client.js8call.last_band_change + interval) > now # hb interval has not passed since last band change (including start)
+                self._client.js8call.activity(age = interval) # recent activity, including text in the text box and queued outgoing msgs
             ):
                 continue
 
@@ -176,15 +194,18 @@ class HeartbeatNetworking:
             self._client.window.sleep_until_next_transition(before = 0.25)
 
             # send heartbeat on next rx/tx window
+            self._outgoing_msg_event.clear()
             hb_msg = self._client.send_heartbeat()
 
-            # wait for sent or failed msg status of outgoing heartbeat msg
-            while (
+            # wait for sent or failed msg status of outgoing heartbeat msg, or disable,
+            # outgoing monitor signals each status update via outgoing_msg()
+            while self._enabled and (
                 self._outgoing_msg is None or
                 self._outgoing_msg.id != hb_msg.id or
                 self._outgoing_msg.status not in (Message.STATUS_SENT, Message.STATUS_FAILED)
             ):
-                time.sleep(0.1)
+                self._outgoing_msg_event.wait()
+                self._outgoing_msg_event.clear()
 
             self._offset.pause()
             self._client.settings.set_offset(last_offset)
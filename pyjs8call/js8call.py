@@ -32,14 +32,35 @@ import os
 import time
 import json
 import psutil
+import select
 import socket
 import threading
+from collections import deque
 from datetime import datetime
 
 import pyjs8call
 from pyjs8call import Message
 
 
+# state request response message type to (state item, message attribute)
+_MSG_TYPE_STATES = {
+    Message.STATION_CALLSIGN: ('callsign', 'value'),
+    Message.STATION_GRID: ('grid', 'value'),
+    Message.STATION_INFO: ('info', 'value'),
+    Message.MODE_SPEED: ('speed', 'speed'),
+    Message.TX_TEXT: ('tx_text', 'value'),
+    Message.RX_TEXT: ('rx_text', 'value'),
+    Message.RX_SELECTED_CALL: ('selected_call', 'value'),
+    Message.RX_CALL_ACTIVITY: ('call_activity', 'call_activity'),
+    Message.RX_BAND_ACTIVITY: ('band_activity', 'band_activity')
+}
+
+# all JS8Call commands, for constant time command lookup on every received message
+_COMMANDS = frozenset(Message.COMMANDS)
+# socket send and receive buffer size in bytes
+_SOCKET_BUFFER_SIZE = 1 << 20
+
+
 class JS8Call:
     '''Low-level JS8Call TCP socket and local state management.
 
@@ -64,12 +85,23 @@ class JS8Call:
         self._client = client
         self._host = host
         self._port = port
-        self._rx_queue = []
-        self._rx_queue_lock = threading.Lock()
-        self._tx_queue = []
-        self._tx_queue_lock = threading.Lock()
+        self._rx_queue = deque()
+        self._rx_queue_lock = threading.Condition()
+        self._tx_queue = deque()
+        self._tx_queue_lock = threading.Condition()
+        # msgs removed from the tx queue and being sent, visible to activity() until sent or requeued
+        self._tx_in_flight = []
         self._socket = None
         self._socket_ping_delay = 60 # seconds
+        # socket read buffer, and received data not yet terminated by a newline
+        self._rx_chunk = bytearray(65535)
+        self._rx_chunk_view = memoryview(self._rx_chunk)
+        self._rx_buffer = bytearray()
+        # wakes the rx thread from select() on stop, created on start and closed by the rx thread on exit
+        self._rx_wake_r = None
+        self._rx_wake_w = None
+        # set on stop, wakes waiting threads
+        self._shutdown_event = threading.Event()
         self.connected = False
         '''bool: Whether the JS8Call TCP socket is connected'''
 
@@ -80,7 +112,7 @@ class JS8Call:
         self._log_path = os.path.join(os.path.expanduser('~'), 'pyjs8call.log')
         self._log_queue = ''
         self._log_queue_lock = threading.Lock()
-        self._debug_log_type_blacklist = [
+        self._debug_log_type_blacklist = frozenset([
             Message.TX_GET_TEXT,        # every second for outgoing monitor
             Message.TX_TEXT,            # every second for outgoing monitor
             Message.RIG_PTT,            # too frequent, not useful
@@ -88,10 +120,15 @@ class JS8Call:
             Message.STATION_STATUS,     # too frequent
             Message.RIG_GET_FREQ,       # every window transition for offset monitor
             Message.RIG_FREQ            # every window transition for offset monitor
-        ]
-
-        self._spots = []
-        self._recent_spots = []
+        ])
+
+        # chronological, oldest spots culled from the left
+        self._spots = deque()
+        # recent spot (timestamp, (origin, offset, snr)) pairs, with sets for duplicate checks
+        # equivalent to pyjs8call.message.Message equality for incoming messages
+        self._recent_spots = deque()
+        self._recent_spot_timestamps = set()
+        self._recent_spot_events = set()
         self._spots_lock = threading.Lock()
 
         self._last_incoming_by_band = dict()
@@ -224,6 +261,18 @@ class JS8Call:
                 'msg_type': Message.RX_GET_SELECTED_CALL
             }
         }
+        # set when the associated state value is updated, see watch()
+        self._state_events = {item: threading.Event() for item in self._state}
+        # message type to handler function, see _process_message()
+        # handlers return the processed message, or None to drop the message
+        self._msg_type_handlers = {
+            Message.INBOX_MESSAGES: self._process_inbox_messages,
+            Message.RX_SPOT: self._process_spot,
+            Message.RX_DIRECTED: self._process_directed,
+            Message.RIG_FREQ: self._process_rig_freq,
+            Message.RIG_PTT: self._process_rig_ptt,
+            Message.STATION_STATUS: self._process_station_status
+        }
         
         self.app = pyjs8call.AppMonitor(self)
         '''pyjs8call.appmonitor: Application monitor object'''
@@ -264,16 +313,21 @@ class JS8Call:
         else:
             timer_out_path = os.path.join(os.path.expanduser('~'), '.local/share/JS8Call/timer.out')
             
-        if os.path.exists(timer_out_path):
-            # allow processes to release file handle on restart
-            timeout = time.time() + 10 # 10 seconds
-            while time.time() < timeout:
-                try:
-                    os.remove(timer_out_path)
-                    break
-                except PermissionError:
-                    time.sleep(0.5)
+        # allow processes to release file handle on restart
+        timeout = time.monotonic() + 10 # 10 seconds
+        while time.monotonic() < timeout:
+            try:
+                os.remove(timer_out_path)
+                break
+            except FileNotFoundError:
+                break
+            except PermissionError:
+                time.sleep(0.5)
         
+        # reset after a previous stop
+        self._shutdown_event.clear()
+        self._rx_wake_r, self._rx_wake_w = socket.socketpair()
+        self._rx_wake_w.setblocking(False)
         self.online = True
         self.app.start(headless=headless, args = args)
 
@@ -290,7 +344,7 @@ class JS8Call:
         log_thread.start()
 
         time.sleep(1)
-        timeout = time.time() + 60
+        timeout = time.monotonic() + 60
 
         # wait for application to respond
         while True:
@@ -304,7 +358,7 @@ class JS8Call:
             except ValueError:
                 pass
 
-            if time.time() > timeout:
+            if time.monotonic() > timeout:
                 RuntimeError('JS8Call application failed to start')
 
         ping_thread = threading.Thread(target=self._ping)
@@ -355,6 +409,12 @@ class JS8Call:
     def stop(self):
         '''Stop threads and JS8Call application.'''
         self.online = False
+        self._shutdown_event.set()
+        self._wake_rx()
+
+        with self._tx_queue_lock:
+            self._tx_queue_lock.notify()
+
         self._socket.close()
         self.app.stop()
 
@@ -427,7 +487,7 @@ class JS8Call:
         Returns:
             list: Frequency band designators like \'40m\'
         '''
-        return list(self._last_incoming_by_band.keys())
+        return list(self._last_incoming_by_band)
 
     def activity(self, age=0):
         '''Whether there is outgoing activity.
@@ -442,10 +502,12 @@ class JS8Call:
         outgoing_text = bool(self.get_state('tx_text') not in (None, ''))
 
         with self._tx_queue_lock:
-            # count of queued outgoing user msgs
-            queued_outgoing = bool(len([msg for msg in self._tx_queue if msg.type in Message.USER_MSG_TYPES]) > 0)
+            # queued outgoing user msgs
+            queued_outgoing = any(msg.type in Message.USER_MSG_TYPES for msg in self._tx_queue)
+            # outgoing user msgs removed from the queue but not yet sent
+            sending_outgoing = any(msg.type in Message.USER_MSG_TYPES for msg in self._tx_in_flight)
 
-        return any((outgoing_text, queued_outgoing, activity_age))
+        return any((outgoing_text, queued_outgoing, sending_outgoing, activity_age))
     
     def block_until_inactive(self, age=0):
         '''Block until not outgoing activity.
@@ -463,8 +525,15 @@ class JS8Call:
 
         This function is for internal use only.
         '''
+        # discard partial message from previous connection
+        self._rx_buffer.clear()
         self._socket = socket.socket()
+        # set buffer sizes before connecting so the receive window is sized accordingly
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
         self._socket.connect((self._host, int(self._port)))
+        # messages are small request/response json objects, send without nagle delay
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._socket.settimeout(1)
 
     def send(self, msg):
@@ -480,6 +549,7 @@ class JS8Call:
 
         with self._tx_queue_lock:
             self._tx_queue.append(msg)
+            self._tx_queue_lock.notify()
         
     def append_to_rx_queue(self, msg):
         '''Queue received message from the JS8Call application for handling.
@@ -493,21 +563,30 @@ class JS8Call:
 
         with self._rx_queue_lock:
             self._rx_queue.append(msg)
+            self._rx_queue_lock.notify()
 
-    def get_next_message(self):
+    def get_next_message(self, timeout=None):
         '''Get next received message from the queue.
 
         Sets the status of the message object to *received* (see pyjs8call.message statuses).
 
+        Args:
+            timeout (float): Maximum seconds to wait for a message, defaults to None (return immediately)
+
         Returns:
-            pyjs8call.message: Message to be handled
+            pyjs8call.message: Message to be handled, or None if the queue is empty
         '''
-        if len(self._rx_queue) > 0:
-            with self._rx_queue_lock:
-                msg = self._rx_queue.pop(0)
+        with self._rx_queue_lock:
+            if timeout is not None:
+                self._rx_queue_lock.wait_for(lambda: len(self._rx_queue) > 0, timeout)
+
+            try:
+                msg = self._rx_queue.popleft()
+            except IndexError:
+                return None
 
-            msg.status = Message.STATUS_RECEIVED
-            return msg
+        msg.status = Message.STATUS_RECEIVED
+        return msg
 
     def get_state(self, state):
         '''Get asynchronous state value.
@@ -550,7 +629,13 @@ class JS8Call:
         '''
         if item in self._state:
             self._state[item]['value'] = value
-            self._state[item]['last_update'] = time.time()
+            self._state[item]['last_update'] = time.monotonic()
+            self._state_events[item].set()
+
+            if item == 'tx_text':
+                # wake the tx thread to check held messages
+                with self._tx_queue_lock:
+                    self._tx_queue_lock.notify()
     
     def watching(self, state=None):
         '''Get internal asynchronous setting state.
@@ -592,13 +677,17 @@ class JS8Call:
 
         self._watching = item
         last_state = self._state[item]['value']
+        state_event = self._state_events[item]
+        state_event.clear()
         self._state[item]['value'] = None
-        timeout = time.time() + self._watch_timeout
+        timeout = time.monotonic() + self._watch_timeout
 
-        while timeout > time.time():
-            if self._state[item]['value'] is not None:
+        # wait for state update, ignoring updates to None
+        while self._state[item]['value'] is None:
+            if not state_event.wait(timeout - time.monotonic()):
                 break
-            time.sleep(0.001)
+
+            state_event.clear()
 
         if self._state[item]['value'] is None:
             # timeout occurred, revert to last state
@@ -611,10 +700,10 @@ class JS8Call:
         '''Get spotted message objects.
         
         Returns:
-            list: spot message objects
+            list: spot message objects (a copy, safe to iterate while new spots are stored)
         '''
         with self._spots_lock:
-             return self._spots
+             return list(self._spots)
 
     def get_spots_str(self):
         '''Get spotted message objects as json string.
@@ -638,7 +727,7 @@ class JS8Call:
             if append:
                 self._spots.extend(spots)
             else:
-                self._spots = spots
+                self._spots = deque(spots)
 
     def set_spots_str(self, spots, append=True):
         '''Set spotted message objects from json string.
@@ -664,17 +753,29 @@ class JS8Call:
         Args:
             msg (pyjs8call.message): Message to spot
         '''
-        # cull recent spots
-        self._recent_spots = [spot for spot in self._recent_spots if spot.age() < 10]
+        # cull recent spots, chronological so stop at the first spot less than 10 seconds old
+        now = time.time()
+
+        while len(self._recent_spots) > 0 and now - self._recent_spots[0][0] >= 10:
+            timestamp, event = self._recent_spots.popleft()
+            self._recent_spot_timestamps.discard(timestamp)
+            self._recent_spot_events.discard(event)
+
+        # same message, or same station event reported by different api messages
+        event = (msg.origin, msg.offset, msg.snr)
 
         with self._spots_lock:
-            if msg not in self._recent_spots:
-                self._recent_spots.append(msg)
+            if msg.timestamp not in self._recent_spot_timestamps and event not in self._recent_spot_events:
+                self._recent_spots.append((msg.timestamp, event))
+                self._recent_spot_timestamps.add(msg.timestamp)
+                self._recent_spot_events.add(event)
                 self._spots.append(msg)
     
-            # cull spots
-            while len(self._spots) > 0 and self._spots[0].age() > self._client.max_spot_age:
-                self._spots.pop(0)
+            # cull spots, chronological so stop at the first spot within the max spot age
+            min_timestamp = now - self._client.max_spot_age
+
+            while len(self._spots) > 0 and self._spots[0].timestamp < min_timestamp:
+                self._spots.popleft()
 
     def _log_msg(self, msg):
         '''Add message to log queue.'''
@@ -692,12 +793,14 @@ class JS8Call:
     def _log_monitor(self):
         '''Log queue monitor thread.'''
         while self.online:
+            # wait first so queued log messages are written on stop
+            self._shutdown_event.wait(1)
+
             if len(self._log_queue) > 0:
                 with self._log_queue_lock:
                     with open(self._log_path, 'a', encoding='utf-8') as fd:
                         fd.write(self._log_queue)
                     self._log_queue = ''
-            time.sleep(1)
 
     def _ping(self):
         '''JS8Call application ping thread.
@@ -708,13 +811,14 @@ class JS8Call:
             # if no recent api msgs, check the connection by making a request
             timeout = self._last_incoming_api_msg + self._socket_ping_delay
 
-            if time.time() > timeout:
+            if time.monotonic() > timeout:
                 self.connected = False
                 msg = Message()
                 msg.type = Message.STATION_GET_CALLSIGN
                 self.send(msg)
                 
-            time.sleep(5)
+            if self._shutdown_event.wait(5):
+                return
 
     def _state_monitor(self):
         '''Local state monitor thread.
@@ -722,14 +826,16 @@ class JS8Call:
         Minimum update frequency is 0.5 seconds.
         '''
         # allow initial api messages and requests to initialize state
-        time.sleep(2)
+        if self._shutdown_event.wait(2):
+            return
         
         while self.online:
-            time.sleep(0.05)
+            if self._shutdown_event.wait(0.05):
+                return
             
             for item in self._state:
                 update = False
-                now = time.time()
+                now = time.monotonic()
                 
                 update_frequency = self._state[item]['update_frequency'] # seconds
                 last_update = self._state[item]['last_update'] # timestamp
@@ -763,6 +869,45 @@ class JS8Call:
                     
                     self._state[item]['last_update_request'] = now
 
+    def _next_tx_msgs(self, hold_user_msgs=False):
+        '''Remove and return the next queued messages to send together.
+
+        A user message (see pyjs8call.message.Message.USER_MSG_TYPES) is always sent alone. Consecutive other messages are sent together, without reordering them around queued user messages.
+
+        Must be called while holding *_tx_queue_lock*.
+
+        Args:
+            hold_user_msgs (bool): Skip queued user messages, leaving them queued in order, defaults to False
+
+        Returns:
+            list: Next messages to send, or an empty list if there is no message to send
+        '''
+        msgs = []
+
+        while len(self._tx_queue) > 0:
+            if not hold_user_msgs:
+                if len(msgs) > 0 and self._tx_queue[0].type in Message.USER_MSG_TYPES:
+                    break
+
+                msg = self._tx_queue.popleft()
+                msgs.append(msg)
+
+                if msg.type in Message.USER_MSG_TYPES:
+                    break
+
+                continue
+
+            for index, msg in enumerate(self._tx_queue):
+                if msg.type not in Message.USER_MSG_TYPES:
+                    del self._tx_queue[index]
+                    msgs.append(msg)
+                    break
+            else:
+                # only held user messages remain
+                break
+
+        return msgs
+
     def _tx(self):
         '''JS8Call application transmit thread.
 
@@ -776,54 +921,63 @@ class JS8Call:
         active_tx_state = False
 
         while self.online:
-            # TxMonitor updates tx_text every second
-            if self._state['tx_text']['value'] == '':
-                tx_text = False
-            else:
-                tx_text = True
-                active_tx_state = False
-
             with self._tx_queue_lock:
-                for msg in self._tx_queue.copy():
-                    # hold off on sending messages while there is something being sent (text in the tx text field)
-                    if msg.type in Message.USER_MSG_TYPES and (tx_text or active_tx_state):
-                        continue
-            
-                    packed = msg.pack()
-                    
-                    if self._debug and (self._debug_all or (msg.type not in self._debug_log_type_blacklist)):
-                        print('TX: ' + packed.decode('utf-8').strip())
-    
-                    if self._log and (self._log_all or (msg.type not in self._debug_log_type_blacklist)):
+                # TxMonitor updates tx_text every second
+                if self._state['tx_text']['value'] == '':
+                    tx_text = False
+                else:
+                    tx_text = True
+                    active_tx_state = False
+
+                # hold off on sending messages while there is something being sent (text in the tx text field)
+                msgs = self._next_tx_msgs(hold_user_msgs = tx_text or active_tx_state)
+
+                if len(msgs) == 0:
+                    # nothing to send, wake when a message is queued or the tx text state updates
+                    self._tx_queue_lock.wait(1)
+                    continue
+
+                self._tx_in_flight = msgs
+
+            # send without holding the queue lock during socket i/o
+            if self._debug or self._log:
+                for msg in msgs:
+                    blacklisted = msg.type in self._debug_log_type_blacklist
+
+                    if self._debug and (self._debug_all or not blacklisted):
+                        print('TX: ' + msg.pack().decode('utf-8').strip())
+
+                    if self._log and (self._log_all or not blacklisted):
                         self._log_msg(msg)
-    
-                    try:
-                        self._socket.sendall(packed)
-                        self._tx_queue.remove(msg)
-
-                        if msg.type in Message.USER_MSG_TYPES:
-                            self.last_outgoing = time.time()
-                            # make sure the next queued msg doesn't get sent before the tx text state updates
-                            active_tx_state = True
-
-                    except (BrokenPipeError, ValueError, OSError):
-                        # BrokenPipeError may happen when restarting due to closed socket
-                        # ValueError may happen when restarting, tx_queue.remove fails (possibly due to PEP 475)
-                        # OSError may happen when stopping during msg processing, socket.sendall fails
-                        pass
-
-                    if not self.online:
-                        return
-    
-                    time.sleep(0.1)
-    
-            time.sleep(0.1)
+
+            try:
+                # one socket write for consecutive non-user messages
+                self._socket.sendall(b''.join(msg.pack() for msg in msgs))
+
+                if msgs[0].type in Message.USER_MSG_TYPES:
+                    # set before clearing in flight msgs so activity() sees no gap
+                    self.last_outgoing = time.time()
+                    # make sure the next queued msg doesn't get sent before the tx text state updates
+                    active_tx_state = True
+
+                with self._tx_queue_lock:
+                    self._tx_in_flight = []
+
+            except (BrokenPipeError, OSError):
+                # BrokenPipeError may happen when restarting due to closed socket
+                # OSError may happen when stopping during msg processing, socket.sendall fails
+                # requeue msgs in order and wait before trying again
+                with self._tx_queue_lock:
+                    self._tx_queue.extendleft(reversed(msgs))
+                    self._tx_in_flight = []
+
+                self._shutdown_event.wait(0.1)
 
     def _rx(self):
         '''JS8Call application receive thread.
 
-        A byte string is read from the TCP socket and parsed into a pyjs8call.message. Socket data is discarded in the following cases:
-            - Failure to decode received byte string to UTF-8 (likely due to corrupted or incomplete data)
+        A byte string is read from the TCP socket, buffered until one or more complete newline terminated messages are received, and parsed into a pyjs8call.message. Socket data is discarded in the following cases:
+            - Failure to decode a received message to UTF-8 (likely due to corrupted data, other messages in the same read are still processed)
             - Length of received byte string is zero (no data received)
             - Failure to parse received data into a pyjs8call.message (likely due to corrupted or incomplete data)
             - Parsed message value contains the JS8Call error character (defaults to an ellipsis)
@@ -832,12 +986,31 @@ class JS8Call:
 
         If debugging is enabled (see pyjs8call.client.Client.start) then the byte string of each message sent over the TCP socket is printed to the console. By default not all messages are printed in debug mode (see pyjs8call.js8call.JS8Call._debug_type_blacklist). Frequently sent and received messages used internal to pyjs8call are not printed.
         '''
+        # wake sockets for this thread, replaced on the next start
+        wake_r = self._rx_wake_r
+        wake_w = self._rx_wake_w
+
         while self.online:
-            data = b''
-            data_str = ''
+            try:
+                # wait for received data or a wake up from stop()
+                readable = select.select((self._socket, wake_r), (), (), 1)[0]
+            except (OSError, ValueError):
+                # OSError or ValueError occurs while app is restarting (closed socket)
+                self.connected = False
+                # avoid spinning until the socket is reconnected
+                time.sleep(0.1)
+                continue
+
+            if wake_r in readable:
+                wake_r.recv(1024)
+                continue
+
+            # select timeout, no data received
+            if len(readable) == 0:
+                continue
 
             try:
-                data += self._socket.recv(65535)
+                size = self._socket.recv_into(self._rx_chunk)
             except socket.timeout:
                 # if rx from socket fails continue trying
                 continue
@@ -846,25 +1019,38 @@ class JS8Call:
                 self.connected = False
                 continue
 
-            try: 
-                data_str = data.decode('utf-8')
-            except UnicodeDecodeError:
-                # if decode fails, stop processing
-                continue
-
             # if rx data is empty, stop processing
-            if len(data_str) == 0:
+            if size == 0:
                 continue
 
             # restore connected state after being disconnected
-            self.connected = True
+            if not self.connected:
+                self.connected = True
 
-            # split received data into messages
-            msgs = data_str.split('\n')
+            # messages are newline terminated, but a message may be split across socket reads
+            self._rx_buffer += self._rx_chunk_view[:size]
+            end = self._rx_buffer.rfind(b'\n')
+
+            # no complete message yet, wait for more data
+            if end < 0:
+                continue
+
+            # keep partial message following the last newline for the next read
+            data = bytes(self._rx_buffer[:end])
+            del self._rx_buffer[:end + 1]
+            # once per read rather than per message, only used by the ping thread (one minute resolution)
+            self._last_incoming_api_msg = time.monotonic()
 
-            for msg_str in msgs:
+            # split received data into messages
+            for msg_bytes in data.split(b'\n'):
                 # if message is empty, stop processing
-                if len(msg_str) == 0:
+                if len(msg_bytes) == 0:
+                    continue
+
+                try:
+                    msg_str = msg_bytes.decode('utf-8')
+                except UnicodeDecodeError:
+                    # if decode fails, stop processing this message only
                     continue
 
                 try:
@@ -880,19 +1066,34 @@ class JS8Call:
                     self.last_incoming = time.time()
 
                 msg.status = Message.STATUS_RECEIVED
-                self._last_incoming_api_msg = time.time()
                 
-                # print msg in debug mode
-                if self._debug and (self._debug_all or (msg.type not in self._debug_log_type_blacklist)):
-                    print('RX: ' + json.dumps(msg.dict()))
+                if self._debug or self._log:
+                    blacklisted = msg.type in self._debug_log_type_blacklist
 
-                # log msg
-                if self._log and (self._log_all or (msg.type not in self._debug_log_type_blacklist)):
-                    self._log_msg(msg)
+                    # print msg in debug mode
+                    if self._debug and (self._debug_all or not blacklisted):
+                        print('RX: ' + json.dumps(msg.dict()))
+
+                    # log msg
+                    if self._log and (self._log_all or not blacklisted):
+                        self._log_msg(msg)
 
                 self._process_message(msg)
 
-        time.sleep(0.1)
+        wake_r.close()
+        wake_w.close()
+
+    def _wake_rx(self):
+        '''Wake the rx thread if it is waiting for received data.'''
+        if self._rx_wake_w is None:
+            # not started
+            return
+
+        try:
+            self._rx_wake_w.send(b'\x00')
+        except OSError:
+            # wake socket buffer full (rx thread already waking) or closed (rx thread stopped)
+            pass
 
     def _process_message(self, msg):
         '''Process received message.
@@ -904,6 +1105,14 @@ class JS8Call:
         Args:
             msg (pyjs8call.message): Message to process
         '''
+        # fast path for the highest rate messages, activity state responses have no grid or command
+        if msg.type == Message.RX_BAND_ACTIVITY or msg.type == Message.RX_CALL_ACTIVITY:
+            msg.set('profile', self._client.settings.get_profile())
+            item, attribute = _MSG_TYPE_STATES[msg.type]
+            self._set_state(item, getattr(msg, attribute))
+            self.append_to_rx_queue(msg)
+            return
+
         # try to get distance and bearing
         if msg.get('grid') not in (None, ''):
             try:
@@ -921,90 +1130,85 @@ class JS8Call:
         
         ### command handling ###
 
-        if msg.cmd in Message.COMMANDS:
+        if msg.cmd in _COMMANDS:
             self._spot(msg)
 
 
         ### message type handling ###
 
-        if msg.type == Message.INBOX_MESSAGES:
-            self._set_state('inbox', msg.messages)
-
-        elif msg.type == Message.RX_SPOT:
-            self._spot(msg)
-
-        elif msg.type == Message.RX_DIRECTED:
-            # custom processing of incoming messages
-            if self._client.process_incoming is not None:
-                msg = self._client.process_incoming(msg)
-
-                if msg is None:
-                    return
-            
-            # clean msg text to remove callsigns, etc
-            if self._client.clean_directed_text:
-                msg = self._client.clean_rx_message_text(msg)
-
-            self._spot(msg)
-
-        elif msg.type == Message.RIG_FREQ:
-            previous_freq = self._state['dial']['value']
-
-            self._set_state('dial', msg.dial)
-            self._set_state('freq', msg.freq)
-            self._set_state('offset', msg.offset)
+        state = _MSG_TYPE_STATES.get(msg.type)
 
-            if msg.get('band') is not None:
-                self._set_state('band', msg.band)
-                self.process_freq_change(previous_freq)
-
-        elif msg.type == Message.RIG_PTT:
-            if msg.value == 'on':
-                self._set_state('ptt', True)
-            else:
-                self._set_state('ptt', False)
+        if state is not None:
+            # response to state request
+            item, attribute = state
+            self._set_state(item, getattr(msg, attribute))
 
-        elif msg.type == Message.STATION_STATUS:
-            previous_freq = self._state['dial']['value']
+        elif msg.type in self._msg_type_handlers:
+            msg = self._msg_type_handlers[msg.type](msg)
 
-            self._set_state('dial', msg.dial)
-            self._set_state('freq', msg.freq)
-            self._set_state('offset', msg.offset)
-            self._set_state('speed', msg.speed)
+            if msg is None:
+                return
 
-            self.process_freq_change(previous_freq)
+        self.append_to_rx_queue(msg)
 
-        elif msg.type == Message.STATION_CALLSIGN:
-            self._set_state('callsign', msg.value)
+    def _process_inbox_messages(self, msg):
+        '''Process inbox messages response.'''
+        self._set_state('inbox', msg.messages)
+        return msg
 
-        elif msg.type == Message.STATION_GRID:
-            self._set_state('grid', msg.value)
+    def _process_spot(self, msg):
+        '''Process spot message.'''
+        self._spot(msg)
+        return msg
 
-        elif msg.type == Message.STATION_INFO:
-            self._set_state('info', msg.value)
+    def _process_directed(self, msg):
+        '''Process directed message.
 
-        elif msg.type == Message.MODE_SPEED:
-            self._set_state('speed', msg.speed)
+        Returns:
+            pyjs8call.message: Processed message, or None if dropped by *client.process_incoming*
+        '''
+        # custom processing of incoming messages
+        if self._client.process_incoming is not None:
+            msg = self._client.process_incoming(msg)
 
-        elif msg.type == Message.TX_TEXT:
-            self._set_state('tx_text', msg.value)
+            if msg is None:
+                return None
 
-        elif msg.type == Message.RX_TEXT:
-            self._set_state('rx_text', msg.value)
+        # clean msg text to remove callsigns, etc
+        if self._client.clean_directed_text:
+            msg = self._client.clean_rx_message_text(msg)
 
-        elif msg.type == Message.RX_SELECTED_CALL:
-            self._set_state('selected_call', msg.value)
+        self._spot(msg)
+        return msg
 
-        elif msg.type == Message.RX_CALL_ACTIVITY:
-            self._set_state('call_activity', msg.call_activity)
+    def _process_rig_freq(self, msg):
+        '''Process rig frequency response.'''
+        previous_freq = self._state['dial']['value']
+        self._set_state('dial', msg.dial)
+        self._set_state('freq', msg.freq)
+        self._set_state('offset', msg.offset)
 
-        elif msg.type == Message.RX_BAND_ACTIVITY:
-            self._set_state('band_activity', msg.band_activity)
+        if msg.get('band') is not None:
+            self._set_state('band', msg.band)
+            self.process_freq_change(previous_freq)
 
-        elif msg.type == Message.RX_ACTIVITY:
-            pass
+        return msg
 
-        elif msg.type == Message.TX_FRAME:
-            pass
-            
-        self.append_to_rx_queue(msg)
+    def _process_rig_ptt(self, msg):
+        '''Process rig PTT message.'''
+        if msg.value == 'on':
+            self._set_state('ptt', True)
+        else:
+            self._set_state('ptt', False)
+
+        return msg
+
+    def _process_station_status(self, msg):
+        '''Process station status message.'''
+        previous_freq = self._state['dial']['value']
+        self._set_state('dial', msg.dial)
+        self._set_state('freq', msg.freq)
+        self._set_state('offset', msg.offset)
+        self._set_state('speed', msg.speed)
+        self.process_freq_change(previous_freq)
+        return msg
@@ -534,7 +534,7 @@ class Message:
         # parse top level message fields
         self.type = msg['type'].strip()
         
-        if 'value' in msg.keys():
+        if 'value' in msg:
             self.value = msg['value'].strip()
 
         # parse paramater fields
@@ -594,24 +594,22 @@ class Message:
         elif self.type == Message.RX_BAND_ACTIVITY:
             self.band_activity = []
             for key, value in msg['params'].items():
-                try:
-                    # skip if key is not a freq offset (int)
-                    int(key)
-
-                    dt_utc = datetime.utcfromtimestamp(value['UTC'] / 1000) # milliseconds to seconds
-
-                    self.band_activity.append({
-                        'freq' : value['DIAL'],
-                        'offset' : value['OFFSET'],
-                        'snr' : value['SNR'],
-                        'timestamp' : dt_utc.timestamp(),
-                        'utc_time_str' : '{} UTC'.format(dt_utc.strftime('%X')),
-                        'local_time_str' : '{}L'.format(dt_utc.astimezone().strftime('%X')),
-                        'text' : value['TEXT']
-                    })
-                except ValueError:
+                # skip if key is not a freq offset (int), without raising an exception per key
+                if not key.isdigit():
                     continue
 
+                dt_utc = datetime.utcfromtimestamp(value['UTC'] / 1000) # milliseconds to seconds
+
+                self.band_activity.append({
+                    'freq' : value['DIAL'],
+                    'offset' : value['OFFSET'],
+                    'snr' : value['SNR'],
+                    'timestamp' : dt_utc.timestamp(),
+                    'utc_time_str' : '{} UTC'.format(dt_utc.strftime('%X')),
+                    'local_time_str' : '{}L'.format(dt_utc.astimezone().strftime('%X')),
+                    'text' : value['TEXT']
+                })
+
         # command handling
 
         if self.cmd == Message.CMD_GRID and self.text is not None and Message.ERR not in self.text:
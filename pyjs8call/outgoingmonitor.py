@@ -34,10 +34,15 @@ __docformat__ = 'google'
 
 import time
 import threading
+from collections import deque
 
 from pyjs8call import Message
 
 
+# characters stripped from the ends of tx text
+_STRIP_CHARS = ' ' + Message.EOM
+
+
 class OutgoingMonitor:
     '''Monitor JS8Call outgoing message text.
     
@@ -74,8 +79,8 @@ class OutgoingMonitor:
         self._client = client
         self._enabled = False
         self._paused = False
-        self._msg_queue = []
-        self._msg_queue_lock = threading.Lock()
+        self._msg_queue = deque()
+        self._msg_queue_lock = threading.Condition()
         # initialize msg max age to 10 minutes
         self._msg_max_age = 10 * 60 # 10 minutes
 
@@ -110,6 +115,9 @@ class OutgoingMonitor:
         '''Disable outgoing message monitoring.'''
         self._enabled = False
 
+        with self._msg_queue_lock:
+            self._msg_queue_lock.notify()
+
     def pause(self):
         '''Pause outgoing message monitoring.'''
         self._paused = True
@@ -145,12 +153,17 @@ class OutgoingMonitor:
         msg.status = Message.STATUS_QUEUED
 
         with self._msg_queue_lock:
-            self._msg_queue.append(msg)
+            # msg value is compared to tx text once the msg is packed for sending
+            self._msg_queue.append((msg, None, msg.cmd in Message.CHECKSUM_COMMANDS))
+            # check the new msg without waiting for the next poll
+            self._msg_queue_lock.notify()
             
     def _monitor(self):
         '''Tx monitor thread.'''
         while self._enabled:
-            time.sleep(0.5)
+            # poll tx text to detect autoreplies, wake early when a msg is queued
+            with self._msg_queue_lock:
+                self._msg_queue_lock.wait(0.5)
 
             if self._paused:
                 continue
@@ -166,49 +179,71 @@ class OutgoingMonitor:
             if tx_text != '':
                 self._client.js8call.last_outgoing = time.time()
 
+            # no monitored msgs to compare to the tx text
+            if len(self._msg_queue) == 0:
+                continue
+
             # drop the first callsign and strip spaces and end-of-message
             # original format: 'callsign: callsign  message'
+            # split once, the message may also contain ':'
             if ':' in tx_text:
-                tx_text = tx_text.split(':')[1].strip(' ' + Message.EOM)
+                tx_text = tx_text.split(':', 1)[1]
+
+            tx_text = tx_text.strip(_STRIP_CHARS)
             
             # update msg max age based on speed setting (60 tx cycles)
             self._msg_max_age = self._client.settings.get_window_duration() * 60
             
             with self._msg_queue_lock:
-                self._process_queue(tx_text)
+                changed_msgs = self._process_queue(tx_text)
+
+            # handle callbacks without holding the queue lock
+            for msg in changed_msgs:
+                self._callback(msg)
 
     def _process_queue(self, tx_text):
-        '''Compare queued message to tx text.'''
-        tx_text_wo_checksum = ' '.join(tx_text.split()[:-1])
+        '''Compare queued message to tx text.
 
-        for i in range(len(self._msg_queue)):
-            msg = self._msg_queue.pop(0)
+        Returns:
+            list: Messages with changed status, in order of status change
+        '''
+        changed_msgs = []
+        # queued msgs still being monitored, in order
+        msg_queue = deque()
+        tx_text_wo_checksum = ' '.join(tx_text.split()[:-1])
+        # msgs queued before this time are too old
+        expired_timestamp = time.time() - self._msg_max_age
 
-            if msg.packed_dict is None:
-                msg.pack()
+        for msg, msg_value, checksum in self._msg_queue:
+            # msg value is constant once packed, only evaluate it once
+            if msg_value is None:
+                if msg.packed_dict is None:
+                    msg.pack()
 
-            msg_value = msg.packed_dict['value'].strip()
+                msg_value = msg.packed_dict['value'].strip()
 
             if (
-                ( (msg.cmd in Message.CHECKSUM_COMMANDS and msg_value == tx_text_wo_checksum) or msg_value == tx_text ) and
+                ( (checksum and msg_value == tx_text_wo_checksum) or msg_value == tx_text ) and
                 msg.status == Message.STATUS_QUEUED
             ):
                 # msg text was added to js8call tx field, sending
                 msg.set('status', Message.STATUS_SENDING)
-                self._callback(msg)
+                changed_msgs.append(msg)
             elif msg_value != tx_text_wo_checksum and msg_value != tx_text and msg.status == Message.STATUS_SENDING:
                 # msg text was removed from js8call tx field, sent
                 msg.set('status', Message.STATUS_SENT)
-                self._callback(msg)
+                changed_msgs.append(msg)
                 # msg dropped from queue
-                return None
-            elif time.time() > msg.timestamp + self._msg_max_age:
+                continue
+            elif msg.timestamp < expired_timestamp:
                 # msg too old, sending failed
                 msg.set('status', Message.STATUS_FAILED)
                 msg.error = 'failed to send'
-                self._callback(msg)
+                changed_msgs.append(msg)
                 # msg dropped from queue
-                return None
+                continue
+
+            msg_queue.append((msg, msg_value, checksum))
 
-            self._msg_queue.append(msg)
-                        
+        self._msg_queue = msg_queue
+        return changed_msgs
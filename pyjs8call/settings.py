@@ -36,6 +36,14 @@ import pyjs8call
 from pyjs8call import Message
 
 
+# JS8Call submode integer to speed text
+_SUBMODE_SPEEDS = {4: 'slow', 0: 'normal', 1: 'fast', 2: 'turbo', 8: 'ultra'}
+# JS8Call speed text to submode integer
+_SPEED_SUBMODES = {speed: submode for submode, speed in _SUBMODE_SPEEDS.items()}
+# JS8Call speed text to rx/tx window duration in seconds
+_WINDOW_DURATIONS = {'slow': 30, 'normal': 15, 'fast': 10, 'turbo': 6, 'ultra': 4}
+
+
 class Settings:
     '''Settings function container.
     
@@ -542,7 +550,7 @@ class Settings:
         Raises:
             ValueError: Specified profile name does not exist
         '''
-        if profile not in self.get_profile_list():
+        if not self._client.config.profile_exists(profile):
             if create:
                 # copy from Default profile
                 self.create_new_profile(profile)
@@ -706,11 +714,8 @@ class Settings:
         Returns:
             str: Speed as text
         '''
-        # map integer to text
-        speeds = {4:'slow', 0:'normal', 1:'fast', 2:'turbo', 8:'ultra'}
-
-        if submode is not None and int(submode) in speeds:
-            return speeds[int(submode)]
+        if submode is not None and int(submode) in _SUBMODE_SPEEDS:
+            return _SUBMODE_SPEEDS[int(submode)]
         else:
             raise ValueError('Invalid submode \'' + str(submode) + '\'')
 
@@ -760,9 +765,8 @@ class Settings:
 
         '''
         if isinstance(speed, str):
-            speeds = {'slow':4, 'normal':0, 'fast':1, 'turbo':2, 'ultra':8}
-            if speed in speeds:
-                speed = speeds[speed]
+            if speed in _SPEED_SUBMODES:
+                speed = _SPEED_SUBMODES[speed]
             else:
                 raise ValueError('Invalid speed: ' + str(speed))
 
@@ -1130,8 +1134,7 @@ class Settings:
         elif isinstance(speed, int):
             speed = self.submode_to_speed(speed)
 
-        duration = {'slow': 30, 'normal': 15, 'fast': 10, 'turbo': 6, 'ultra':4}
-        return duration[speed]
+        return _WINDOW_DURATIONS[speed]
 
     def enable_daily_restart(self, restart_time='02:00'):
         '''Enable daily JS8Call restart at specified time.
@@ -37,6 +37,7 @@ __docformat__ = 'google'
 
 import threading
 import time
+import traceback
 
 
 class SpotMonitor:
@@ -54,8 +55,8 @@ class SpotMonitor:
         self._client = client
         self._enabled = False
         self._paused = False
-        self._station_watch_list = []
-        self._group_watch_list = []
+        self._station_watch_list = set()
+        self._group_watch_list = set()
 
     def enabled(self):
         '''Get enabled status.
@@ -123,18 +124,34 @@ class SpotMonitor:
         Returns:
             list: Spot messages matching specified filter criteria
         '''
+        # evaluate filter arguments once, not per spot
+        if origin is not None:
+            origin = origin.upper()
+
+        if destination is not None:
+            destination = destination.upper()
+
+        if grid is not None:
+            grid = grid.upper()
+
+        if band is not None:
+            band = band.lower()
+
+        if age != 0:
+            min_timestamp = time.time() - age
+
         spots = []
         
         for spot in self.all():
             if (
-                (age == 0 or spot.age() <= age) and
-                (grid is None or grid.upper() == spot.grid) and
+                (age == 0 or spot.timestamp >= min_timestamp) and
+                (grid is None or grid == spot.grid) and
                 (distance == 0 or (spot.distance is not None and spot.distance <= distance)) and
-                (origin is None or origin.upper() == spot.origin) and 
-                (destination is None or destination.upper() == spot.destination) and
+                (origin is None or origin == spot.origin) and 
+                (destination is None or destination == spot.destination) and
                 (profile is None or profile == spot.profile) and
                 (dial_freq is None or dial_freq == spot.dial) and
-                (band is None or band.lower() == self._client.freq_to_band(spot.freq).lower())
+                (band is None or band == self._client.freq_to_band(spot.freq).lower())
             ):
                 spots.append(spot)
 
@@ -153,8 +170,11 @@ class SpotMonitor:
         Returns:
             str, None: Most recent grid square spotted for *origin*, or None if not found
         '''
-        for spot in self.all():
-            if spot.origin == origin.upper() and spot.grid not in (None, ''):
+        origin = origin.upper()
+
+        # most recent first, stop at the first match
+        for spot in reversed(self.all()):
+            if spot.origin == origin and spot.grid not in (None, ''):
                 return spot.grid
 
         return None
@@ -177,8 +197,7 @@ class SpotMonitor:
         Args:
             station (str): Station callsign to watch for
         '''
-        if station not in self._station_watch_list:
-            self._station_watch_list.append(station)
+        self._station_watch_list.add(station)
 
     def add_group_watch(self, group):
         '''Add watched group.
@@ -189,8 +208,7 @@ class SpotMonitor:
         if group[0] != '@':
             raise ValueError('Group designator must begin with \'@\'')
 
-        if group not in self._group_watch_list:
-            self._group_watch_list.append(group)
+        self._group_watch_list.add(group)
 
     def remove_station_watch(self, station):
         '''Remove watched station.
@@ -198,8 +216,7 @@ class SpotMonitor:
         Args:
             station (str): Station callsign to stop watching for
         '''
-        if station in self._station_watch_list:
-            self._station_watch_list.remove(station)
+        self._station_watch_list.discard(station)
 
     def remove_group_watch(self, group):
         '''Remove watched group.
@@ -210,8 +227,7 @@ class SpotMonitor:
         if group[0] != '@':
             raise ValueError('Group designator must begin with \'@\'')
 
-        if group in self._group_watch_list:
-            self._group_watch_list.remove(group)
+        self._group_watch_list.discard(group)
 
     def get_watched_stations(self):
         '''Get watched stations.
@@ -219,7 +235,7 @@ class SpotMonitor:
         Returns:
             list: Watched station callsigns
         '''
-        return self._station_watch_list
+        return list(self._station_watch_list)
 
     def set_watched_stations(self, stations):
         '''Set watched stations.
@@ -230,7 +246,7 @@ class SpotMonitor:
         if isinstance(stations, str):
             stations = [station.strip() for station in stations.split(',')]
 
-        self._station_watch_list = stations
+        self._station_watch_list = set(stations)
 
     def get_watched_groups(self):
         '''Get watched groups.
@@ -238,7 +254,7 @@ class SpotMonitor:
         Returns:
             list: Watched group designators
         '''
-        return self._group_watch_list
+        return list(self._group_watch_list)
 
     def set_watched_groups(self, groups):
         '''Set watched groups.
@@ -249,13 +265,13 @@ class SpotMonitor:
         if isinstance(groups, str):
             groups = [group.strip() for group in groups.split(',')]
 
-        self._groups_watch_list = groups
+        self._group_watch_list = set(groups)
 
 
     def _callback(self, spots):
         '''New spots callback function handling.
 
-        Calls each callback function in *pyjs8call.client.callback.spots*, *pyjs8call.client.callback.station_spot*, and *pyjs8call.client.callback.group_spot* using *threading.Thread*.
+        Calls each callback function in *pyjs8call.client.callback.spots*, *pyjs8call.client.callback.station_spot*, and *pyjs8call.client.callback.group_spot* using *threading.Thread*. Each station and group spot callback function is called for all of its matching spots in a single thread.
 
         Args:
             spots (list): Spotted message objects
@@ -266,25 +282,44 @@ class SpotMonitor:
                 thread.daemon = True
                 thread.start()
 
-            for spot in spots:
-                if (
-                    len(self._client.callback.station_spot) > 0 and
-                    spot.origin in self._station_watch_list
-                ):
+            station_watch_list = self._station_watch_list
+
+            if len(self._client.callback.station_spot) > 0 and len(station_watch_list) > 0:
+                station_spots = [spot for spot in spots if spot.origin in station_watch_list]
+
+                if len(station_spots) > 0:
                     for callback in self._client.callback.station_spot:
-                        thread = threading.Thread(target=callback, args=(spot,))
+                        thread = threading.Thread(target=self._call_each, args=(callback, station_spots))
                         thread.daemon = True
                         thread.start()
 
-                if (
-                    len(self._client.callback.group_spot) > 0 and
-                    spot.destination in self._group_watch_list
-                ):
+            group_watch_list = self._group_watch_list
+
+            if len(self._client.callback.group_spot) > 0 and len(group_watch_list) > 0:
+                group_spots = [spot for spot in spots if spot.destination in group_watch_list]
+
+                if len(group_spots) > 0:
                     for callback in self._client.callback.group_spot:
-                        thread = threading.Thread(target=callback, args=(spot,))
+                        thread = threading.Thread(target=self._call_each, args=(callback, group_spots))
                         thread.daemon = True
                         thread.start()
 
+    @staticmethod
+    def _call_each(callback, spots):
+        '''Call callback function for each spot, in order.
+
+        Exceptions are printed so that one failing spot does not skip the remaining spots.
+
+        Args:
+            callback (func): Callback function object
+            spots (list): Spotted message objects
+        '''
+        for spot in spots:
+            try:
+                callback(spot)
+            except Exception:
+                traceback.print_exc()
+
     def _monitor(self):
         '''Spot monitor thread.
 
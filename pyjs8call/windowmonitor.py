@@ -63,6 +63,8 @@ class WindowMonitor:
         self._last_rx_msg_timestamp = 0
         self._next_window_timestamp = 0
         self._timestamp_lock = threading.Lock()
+        # set when the next window timestamp changes, wakes the monitor thread
+        self._timestamp_update = threading.Event()
 
     def enabled(self):
         '''Get enabled status.
@@ -95,6 +97,7 @@ class WindowMonitor:
         self._enabled = False
         self._client.callback.remove_incoming(self.process_rx_msg)
         self._client.callback.remove_incoming(self.process_rig_ptt)
+        self._timestamp_update.set()
 
     def reset(self):
         '''Reset rx/tx window monitoring timestamps.
@@ -104,6 +107,7 @@ class WindowMonitor:
         self._next_window_timestamp = 0
         self._last_rig_ptt_timestamp = 0
         self._last_rx_msg_timestamp = 0
+        self._timestamp_update.set()
 
     def _callback(self):
         '''Window transition callback function handling.
@@ -133,7 +137,7 @@ class WindowMonitor:
 
         with self._timestamp_lock:
             self._last_rig_ptt_timestamp = msg.timestamp
-            self._next_window_timestamp = msg.timestamp + window_duration
+            self._set_next_window_timestamp(msg.timestamp + window_duration)
 
     def process_rx_msg(self, msg):
         '''Process incoming message.
@@ -152,7 +156,20 @@ class WindowMonitor:
             with self._timestamp_lock:
                 self._last_rx_msg_timestamp = msg.timestamp
                 # message rx occurs approximately 2 second before the end of the tx window
-                self._next_window_timestamp = msg.timestamp + 2
+                self._set_next_window_timestamp(msg.timestamp + 2)
+
+    def _set_next_window_timestamp(self, timestamp):
+        '''Set next window transition timestamp.
+
+        Must be called while holding *_timestamp_lock*. The monitor thread is only woken if the next transition moves earlier, otherwise it recalculates when its current wait times out.
+
+        Args:
+            timestamp (float): Timestamp of the next window transition
+        '''
+        if self._next_window_timestamp == 0 or timestamp < self._next_window_timestamp:
+            self._timestamp_update.set()
+
+        self._next_window_timestamp = timestamp
 
     def next_transition_timestamp(self, cycles=0, default=None):
         '''Get timestamp of next rx/tx window transition.
@@ -240,6 +257,9 @@ class WindowMonitor:
         '''Window monitor thread.'''
         while self._enabled:
             with self._timestamp_lock:
+                # cleared while holding the lock, so updates after this point wake the thread
+                self._timestamp_update.clear()
+
                 if self._next_window_timestamp != 0 and self._next_window_timestamp < time.time():
                     # window transiton notification via callback function
                     self._callback()
@@ -248,5 +268,12 @@ class WindowMonitor:
                     # increament the window timestamp
                     self._next_window_timestamp += window_duration
 
-            time.sleep(0.01)
+                if self._next_window_timestamp == 0:
+                    # transition unknown, wait for the first message
+                    timeout = None
+                else:
+                    timeout = max(0, self._next_window_timestamp - time.time())
+
+            # sleep until the next transition, or until the next transition timestamp changes
+            self._timestamp_update.wait(timeout)
 